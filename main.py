@@ -151,8 +151,10 @@ class MainWindow(QMainWindow):
         self.sidebar.set_footer_text("")
         
         # Add navigation items from centralized constants
-        for nav_item in SIDEBAR_ITEMS:
-            self.sidebar.add_item(nav_item.icon_name, tr(nav_item.translation_key), tr(nav_item.tooltip_key) if nav_item.tooltip_key else "")
+        self.sidebar.add_items(
+            (nav_item.icon_name, tr(nav_item.translation_key), tr(nav_item.tooltip_key) if nav_item.tooltip_key else "")
+            for nav_item in SIDEBAR_ITEMS
+        )
         
         self.sidebar.set_current_index(0)
         self.sidebar.item_selected.connect(self._on_sidebar_item_selected)
@@ -271,9 +273,8 @@ class MainWindow(QMainWindow):
         if not theme_id:
             return
 
+        # The settings tab has already stored and scheduled a save of the theme
         ThemeManager.apply_theme(theme_id)
-        self.settings.settings.theme = theme_id
-        self.settings.save()
 
         # Refresh sidebar icons
         try:
@@ -284,7 +285,7 @@ class MainWindow(QMainWindow):
         # Refresh theme-aware logos (e.g., About tab)
         try:
             if hasattr(self.tab_settings, "tab_about"):
-                self.tab_settings.tab_about.update_texts()
+                self.tab_settings.tab_about.refresh_logo()
         except Exception:
             pass
     
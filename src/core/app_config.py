@@ -62,6 +62,13 @@ class AppConfigManager:
         self._config = {}
         self._load_config()
     
+    @classmethod
+    def instance(cls) -> 'AppConfigManager':
+        """Get the shared instance without re-running the constructor."""
+        if cls._instance is not None and cls._instance._initialized:
+            return cls._instance
+        return cls()
+    
     def _load_config(self) -> None:
         """Load configuration from file."""
         # In frozen builds, app metadata must be embedded (not shipped as a plain JSON file).
@@ -101,6 +108,11 @@ class AppConfigManager:
             'homepage': ''
         }
     
+    @property
+    def config_path(self) -> Path:
+        """Get the app.json path resolved at startup."""
+        return self._config_path
+    
     @property
     def version(self) -> str:
         """Get application version."""
@@ -148,28 +160,28 @@ class AppConfigManager:
 # Convenience functions
 def get_version() -> str:
     """Get application version."""
-    return AppConfigManager().version
+    return AppConfigManager.instance().version
 
 def get_app_name() -> str:
     """Get application name."""
-    return AppConfigManager().name
+    return AppConfigManager.instance().name
 
 def get_app_description() -> str:
     """Get application description."""
-    return AppConfigManager().description
+    return AppConfigManager.instance().description
 
 def get_app_author() -> str:
     """Get application author."""
-    return AppConfigManager().author
+    return AppConfigManager.instance().author
 
 def get_app_license() -> str:
     """Get application license."""
-    return AppConfigManager().license
+    return AppConfigManager.instance().license
 
 def get_app_repository() -> str:
     """Get repository URL."""
-    return AppConfigManager().repository
+    return AppConfigManager.instance().repository
 
 def get_app_homepage() -> str:
     """Get homepage URL."""
-    return AppConfigManager().homepage
+    return AppConfigManager.instance().homepage
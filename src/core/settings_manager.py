@@ -4,12 +4,21 @@ Handles application settings persistence with JSON storage.
 """
 
 import json
+import os
+import shutil
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 
+# Read once at import; os.umask() can only be queried by setting it, and
+# the mask is process-wide, so doing that on every save would race threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
 @dataclass
 class AppSettings:
     """Application settings data structure."""
@@ -98,9 +107,18 @@ class SettingsManager:
         
         self._auto_save = auto_save
         self._settings = AppSettings()
+        # Last content known to be on disk, used to skip no-op writes
+        self._saved_data: Optional[Dict[str, Any]] = None
         
         self._load()
     
+    @classmethod
+    def instance(cls) -> 'SettingsManager':
+        """Get the shared instance without re-running the constructor."""
+        if cls._instance is not None and cls._instance._initialized:
+            return cls._instance
+        return cls()
+    
     def _load(self) -> None:
         """Load settings from file."""
         if self._settings_path.exists():
@@ -111,6 +129,9 @@ class SettingsManager:
                     for key, value in data.items():
                         if hasattr(self._settings, key):
                             setattr(self._settings, key, value)
+                # Only treat the file as current if it held every field
+                if data.keys() >= asdict(self._settings).keys():
+                    self._saved_data = asdict(self._settings)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Error loading settings: {e}")
     
@@ -118,15 +139,45 @@ class SettingsManager:
         """
         Save settings to file.
         
+        The write is skipped when nothing changed since the last save, and
+        otherwise goes through a temp file so a crash never truncates it.
+        
         Returns:
             True if successful, False otherwise
         """
+        data = asdict(self._settings)
+        if data == self._saved_data:
+            return True
+        
+        # Serialize in one go, before any temp file exists; json.dump issues
+        # a write() per token chunk
+        content = json.dumps(data, indent=2)
+
+        tmp_name = None
         try:
             self._settings_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._settings_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self._settings), f, indent=2)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self._settings_path.parent,
+                prefix=f".{self._settings_path.name}.",
+                suffix=".tmp",
+            )
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            # mkstemp creates the file as 0600; keep the existing mode, or
+            # give a new file the same mode a plain open() would
+            if self._settings_path.exists():
+                shutil.copymode(self._settings_path, tmp_name)
+            else:
+                os.chmod(tmp_name, 0o666 & ~_UMASK)
+            os.replace(tmp_name, self._settings_path)
+            self._saved_data = data
             return True
         except IOError as e:
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
             print(f"Error saving settings: {e}")
             return False
     
@@ -146,6 +197,11 @@ class SettingsManager:
         """Get the settings object."""
         return self._settings
     
+    @property
+    def settings_path(self) -> Path:
+        """Get the settings file path resolved at startup."""
+        return self._settings_path
+    
     def reset_to_defaults(self) -> None:
         """Reset all settings to defaults."""
         self._settings = AppSettings()
@@ -78,6 +78,8 @@ class Icons:
     
     # Cache for rendered icons
     _icon_cache: Dict[str, QIcon] = {}
+    # Cache for decoded/tinted/scaled app logo pixmaps
+    _logo_cache: Dict[tuple, QPixmap] = {}
     
     @classmethod
     def get_icon(cls, name: str, color: Optional[str] = None, size: int = 24) -> QIcon:
@@ -154,6 +156,7 @@ class Icons:
     def clear_cache(cls):
         """Clear the icon cache. Call this when theme changes."""
         cls._icon_cache.clear()
+        cls._logo_cache.clear()
     
     @classmethod
     def get_text_color(cls) -> str:
@@ -198,9 +201,6 @@ class Icons:
         mark using the current theme text color so it always matches the theme.
         """
         path = cls.get_app_logo_path(variant=variant)
-        pixmap = QPixmap(str(path))
-        if pixmap.isNull():
-            return QPixmap()
 
         # Resolve variant behavior.
         effective_variant = (variant or "auto").lower()
@@ -211,6 +211,7 @@ class Icons:
             except Exception:
                 effective_variant = "mono"
 
+        mono_color = None
         if effective_variant == "mono":
             try:
                 from src.ui.theme_manager import ThemeManager
@@ -218,6 +219,17 @@ class Icons:
             except Exception:
                 mono_color = "#e0e0e0"
 
+        # The key captures everything the rendered result depends on
+        cache_key = (str(path), size, effective_variant, mono_color)
+        cached = cls._logo_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        pixmap = QPixmap(str(path))
+        if pixmap.isNull():
+            return QPixmap()
+
+        if mono_color is not None:
             img = pixmap.toImage().convertToFormat(QImage.Format_ARGB32)
             tinted = QImage(img.size(), QImage.Format_ARGB32)
             tinted.fill(Qt.transparent)
@@ -230,7 +242,8 @@ class Icons:
             pixmap = QPixmap.fromImage(tinted)
 
         if size and size > 0:
-            return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        cls._logo_cache[cache_key] = pixmap
         return pixmap
 
     @classmethod
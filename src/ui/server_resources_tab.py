@@ -7,10 +7,16 @@ Provides a file browser for:
 
 import json
 import difflib
+import itertools
 import os
 import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 from PySide6.QtWidgets import (
@@ -18,22 +24,42 @@ from PySide6.QtWidgets import (
     QGroupBox, QFormLayout, QLineEdit, QSpinBox, QCheckBox,
     QTextEdit, QMessageBox, QFileDialog, QComboBox, QScrollArea,
     QFrame, QTabWidget, QSplitter, QListWidget, QListWidgetItem,
-    QTreeWidget, QTreeWidgetItem, QAbstractItemView, QDialog,
+    QTreeWidget, QTreeWidgetItem, QTreeWidgetItemIterator, QAbstractItemView, QDialog,
     QDialogButtonBox, QPlainTextEdit, QMenu, QInputDialog,
     QApplication, QProgressDialog
 )
-from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtCore import Qt, Signal, QSize, QObject, QRunnable, QThreadPool, QTimer, QProcess
 from PySide6.QtGui import QIcon, QColor, QFont, QSyntaxHighlighter, QTextCharFormat, QKeySequence, QShortcut, QTextDocument, QTextCursor
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # Optional: XML formatting falls back to minidom
+    lxml_etree = None
+
 from src.utils.locale_manager import tr
 from src.core.process_utils import is_dayz_server_running
+from src.core.config_preset_manager import ConfigPresetManager
 from src.ui.icons import Icons
 from src.ui.theme_manager import ThemeManager
 from src.ui.widgets import IconButton
 
 
-# Only show/edit these file types in Resources tab
-EDITABLE_EXTENSIONS = {'.cfg', '.xml', '.json'}
+# Only show/edit these file types in Resources tab (lowercase suffixes)
+EDITABLE_EXTENSIONS = frozenset({'.cfg', '.xml', '.json'})
+
+# Resources tree item role holding ("dir" | "file", lowercase suffix)
+_KIND_ROLE = Qt.UserRole + 1
+# Resources tree item role holding the lowercase file/folder name for search
+_SEARCH_NAME_ROLE = Qt.UserRole + 2
+
+# Files above this size open without syntax highlighting (can be re-enabled)
+HIGHLIGHT_SIZE_LIMIT = 2 * 1024 * 1024
+
+# Delay before re-filtering the resources tree while typing in the search box
+SEARCH_DEBOUNCE_MS = 150
+
+# Maximum number of unified diff lines rendered in the save preview
+DIFF_PREVIEW_MAX_LINES = 5000
 
 # File type categories for icons and handling
 FILE_CATEGORIES = {
@@ -49,6 +75,105 @@ MAP_MISSION_FOLDERS = {
     'dayzOffline.sakhal': 'Sakhal',
 }
 
+@lru_cache(maxsize=128)
+def _suffix_to_category(suffix: str) -> str:
+    """Map a lowercase file suffix to its FILE_CATEGORIES key ("" if none)."""
+    for category, info in FILE_CATEGORIES.items():
+        if suffix in info["extensions"]:
+            return category
+    return ""
+
+
+# (unit, divisor, format spec) indexed by bit_length // 10
+_SIZE_UNITS = (
+    ("B", 1, ".0f"),
+    ("KB", 1024, ".1f"),
+    ("MB", 1024 ** 2, ".2f"),
+    ("GB", 1024 ** 3, ".2f"),
+)
+
+
+@lru_cache(maxsize=256)
+def _format_size(size: int) -> str:
+    """Format a byte count with the largest unit it reaches."""
+    index = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    unit, divisor, spec = _SIZE_UNITS[index]
+    return f"{size / divisor:{spec}} {unit}"
+
+
+@dataclass
+class _FolderSnapshot:
+    """In-memory listing of a folder's editable files and non-empty subfolders."""
+    path: Path
+    folders: List["_FolderSnapshot"] = field(default_factory=list)
+    files: List[Tuple[Path, str, Optional[int], Optional[float]]] = field(default_factory=list)  # path, suffix, size, mtime
+
+
+def _scan_folder(path: Path) -> Optional[_FolderSnapshot]:
+    """Scan a folder tree with os.scandir; returns None if it holds no editable files."""
+    try:
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name.lower())
+    except OSError:
+        return None
+
+    snapshot = _FolderSnapshot(path)
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        try:
+            # DirEntry type checks use the cached directory listing data
+            if entry.is_dir():
+                child = _scan_folder(Path(entry.path))
+                if child is not None:
+                    snapshot.folders.append(child)
+                continue
+            suffix = os.path.splitext(entry.name)[1].lower()
+            if suffix in EDITABLE_EXTENSIONS and entry.is_file():
+                try:
+                    st = entry.stat()
+                    size, mtime = st.st_size, st.st_mtime
+                except OSError:
+                    size = mtime = None
+                snapshot.files.append((Path(entry.path), suffix, size, mtime))
+        except OSError:
+            continue
+
+    if not snapshot.folders and not snapshot.files:
+        return None
+    return snapshot
+
+
+_MONO_FONT: Optional[QFont] = None
+
+
+def _mono_font() -> QFont:
+    """Shared monospace font for editor and preview views."""
+    global _MONO_FONT
+    if _MONO_FONT is None:
+        _MONO_FONT = QFont("Consolas", 10)
+        _MONO_FONT.setStyleHint(QFont.TypeWriter)
+        _MONO_FONT.setFixedPitch(True)
+    return _MONO_FONT
+
+
+# Single-pass tokenizers for the syntax highlighters; each match's group
+# name selects the text format.
+_JSON_TOKEN_RE = re.compile(
+    r'(?P<key>"(?:[^"\\]|\\.)*"(?=\s*:))'
+    r'|(?P<string>"(?:[^"\\]|\\.)*")'
+    r'|(?P<number>-?\d+\.?\d*)'
+    r'|(?P<keyword>\b(?:true|false|null)\b)'
+)
+
+_XML_TOKEN_RE = re.compile(
+    r'(?P<comment><!--.*?-->)'
+    r'|(?P<tag></?[a-zA-Z_][\w\-\.]*)'
+    r'|(?P<tag_end>/?>)'
+    r'|(?<=\s)(?P<attr_name>[a-zA-Z_][\w\-\.]*)(?==)'
+    r'|(?<==)(?P<attr_value>"[^"]*")'
+)
+
 
 class JsonSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for JSON files."""
@@ -77,30 +202,17 @@ class JsonSyntaxHighlighter(QSyntaxHighlighter):
         # Bracket format
         self.bracket_format = QTextCharFormat()
         self.bracket_format.setForeground(QColor("#d4d4d4"))
+        
+        self._formats = {
+            "key": self.key_format,
+            "string": self.string_format,
+            "number": self.number_format,
+            "keyword": self.keyword_format,
+        }
     
     def highlightBlock(self, text):
-        # Keys
-        key_pattern = r'"([^"\\]|\\.)*"\s*:'
-        for match in re.finditer(key_pattern, text):
-            self.setFormat(match.start(), match.end() - match.start() - 1, self.key_format)
-        
-        # String values
-        string_pattern = r':\s*"([^"\\]|\\.)*"'
-        for match in re.finditer(string_pattern, text):
-            start = text.find('"', match.start())
-            self.setFormat(start, match.end() - start, self.string_format)
-        
-        # Numbers
-        number_pattern = r':\s*-?\d+\.?\d*'
-        for match in re.finditer(number_pattern, text):
-            start = text.find(match.group().split(':')[1].strip(), match.start())
-            self.setFormat(start, len(match.group().split(':')[1].strip()), self.number_format)
-        
-        # Keywords (true, false, null)
-        for keyword in ['true', 'false', 'null']:
-            pattern = rf'\b{keyword}\b'
-            for match in re.finditer(pattern, text):
-                self.setFormat(match.start(), match.end() - match.start(), self.keyword_format)
+        for match in _JSON_TOKEN_RE.finditer(text):
+            self.setFormat(match.start(), match.end() - match.start(), self._formats[match.lastgroup])
 
 
 class XmlSyntaxHighlighter(QSyntaxHighlighter):
@@ -126,31 +238,68 @@ class XmlSyntaxHighlighter(QSyntaxHighlighter):
         # Comment format (green)
         self.comment_format = QTextCharFormat()
         self.comment_format.setForeground(QColor("#6a9955"))
+        
+        self._formats = {
+            "comment": self.comment_format,
+            "tag": self.tag_format,
+            "tag_end": self.tag_format,
+            "attr_name": self.attr_name_format,
+            "attr_value": self.attr_value_format,
+        }
     
     def highlightBlock(self, text):
-        # Tags
-        tag_pattern = r'</?[a-zA-Z_][\w\-\.]*'
-        for match in re.finditer(tag_pattern, text):
-            self.setFormat(match.start(), match.end() - match.start(), self.tag_format)
-        
-        # Closing brackets
-        for match in re.finditer(r'/?>', text):
-            self.setFormat(match.start(), match.end() - match.start(), self.tag_format)
-        
-        # Attribute names
-        attr_name_pattern = r'\s([a-zA-Z_][\w\-\.]*)='
-        for match in re.finditer(attr_name_pattern, text):
-            self.setFormat(match.start() + 1, match.end() - match.start() - 2, self.attr_name_format)
-        
-        # Attribute values
-        attr_value_pattern = r'="([^"]*)"'
-        for match in re.finditer(attr_value_pattern, text):
-            self.setFormat(match.start() + 1, match.end() - match.start() - 1, self.attr_value_format)
-        
-        # Comments
-        comment_pattern = r'<!--.*?-->'
-        for match in re.finditer(comment_pattern, text):
-            self.setFormat(match.start(), match.end() - match.start(), self.comment_format)
+        for match in _XML_TOKEN_RE.finditer(text):
+            self.setFormat(match.start(), match.end() - match.start(), self._formats[match.lastgroup])
+
+
+class _FileLoader(QObject):
+    """Signals emitted by a background file load."""
+
+    finished = Signal(str, int)  # content, size in bytes
+    error = Signal(str)
+
+
+class _FileLoadTask(QRunnable):
+    """Read a text file on the global thread pool."""
+
+    def __init__(self, file_path: Path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _FileLoader()
+
+    def run(self):
+        try:
+            content = self.file_path.read_text(encoding='utf-8')
+            size = self.file_path.stat().st_size
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(content, size)
+
+
+class _BackupSignals(QObject):
+    """Signals emitted by a background backup copy."""
+
+    finished = Signal(str)  # backup file name
+    error = Signal(str)
+
+
+class _BackupTask(QRunnable):
+    """Copy a file to its backup path on the global thread pool."""
+
+    def __init__(self, source: Path, target: Path):
+        super().__init__()
+        self.source = source
+        self.target = target
+        self.signals = _BackupSignals()
+
+    def run(self):
+        try:
+            shutil.copy2(self.source, self.target)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(self.target.name)
 
 
 class FileEditorDialog(QDialog):
@@ -161,6 +310,14 @@ class FileEditorDialog(QDialog):
         self.file_path = file_path
         self.original_content = ""
         self.highlighter = None
+        self._load_task: Optional[_FileLoadTask] = None
+        self._parsed_json: Any = None
+        self._parsed_json_dirty = True
+
+        # Status strings used on every keystroke/cursor move
+        self._tr_loaded = tr("resources.file_loaded")
+        self._tr_modified = f"* {tr('resources.modified')}"
+        self._tr_position_fmt = tr("resources.position")
         
         self.setWindowTitle(f"{tr('resources.edit_file')}: {file_path.name}")
         self.setMinimumSize(800, 600)
@@ -187,6 +344,15 @@ class FileEditorDialog(QDialog):
         self.lbl_size.setStyleSheet("color: gray; font-size: 11px;")
         header.addWidget(self.lbl_size)
 
+        # Syntax highlighting toggle (only for highlightable types)
+        # Parented up front: the header layout is not installed yet, and
+        # setVisible on a parentless box would open it as its own window
+        self.chk_highlight = QCheckBox(tr("resources.syntax_highlight"), self)
+        self.chk_highlight.setChecked(True)
+        self.chk_highlight.toggled.connect(self._on_highlight_toggled)
+        header.addWidget(self.chk_highlight)
+        self.chk_highlight.setVisible(self.file_path.suffix.lower() in ('.json', '.xml'))
+
         # Fullscreen toggle
         self.btn_fullscreen = IconButton("fullscreen", "", size=16, icon_only=True)
         self.btn_fullscreen.setToolTip(tr("resources.fullscreen"))
@@ -238,10 +404,11 @@ class FileEditorDialog(QDialog):
 
         # Editor
         self.editor = QPlainTextEdit()
-        font = QFont("Consolas", 10)
-        self.editor.setFont(font)
+        self.editor.setFont(_mono_font())
         self.editor.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.editor.setTabStopDistance(40)
+        self.editor.setCenterOnScroll(False)
+        self.editor.document().setMaximumBlockCount(0)
         layout.addWidget(self.editor)
         
         # Status bar
@@ -251,7 +418,7 @@ class FileEditorDialog(QDialog):
         status_layout.addStretch()
         
         # Line/column indicator
-        self.lbl_position = QLabel(tr("resources.position").format(line=1, col=1))
+        self.lbl_position = QLabel(self._tr_position_fmt.format(line=1, col=1))
         self.lbl_position.setStyleSheet("color: gray;")
         status_layout.addWidget(self.lbl_position)
         
@@ -295,76 +462,138 @@ class FileEditorDialog(QDialog):
         layout.addWidget(button_box)
     
     def _load_file(self):
-        """Load file content."""
-        try:
-            self.original_content = self.file_path.read_text(encoding='utf-8')
-            self.editor.setPlainText(self.original_content)
-            
-            self.lbl_path.setText(str(self.file_path))
-            size = self.file_path.stat().st_size
-            self.lbl_size.setText(self._format_size(size))
-            
-            # Apply syntax highlighting based on extension
-            ext = self.file_path.suffix.lower()
-            if ext == '.json':
-                self.highlighter = JsonSyntaxHighlighter(self.editor.document())
-            elif ext == '.xml':
-                self.highlighter = XmlSyntaxHighlighter(self.editor.document())
-            
-            self.lbl_status.setText(tr("resources.file_loaded"))
-            
-        except Exception as e:
-            QMessageBox.critical(self, tr("common.error"), str(e))
-            self.reject()
-    
-    def _format_size(self, size: int) -> str:
-        """Format file size."""
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        else:
-            return f"{size / (1024 * 1024):.2f} MB"
+        """Start loading file content in the background."""
+        self.lbl_path.setText(str(self.file_path))
+        self.lbl_status.setText(tr("common.loading"))
+        self.editor.setReadOnly(True)
+        # The highlighter is attached once the content is in; toggling before
+        # that would race with _on_file_loaded.
+        self.chk_highlight.setEnabled(False)
+
+        self._load_task = _FileLoadTask(self.file_path)
+        self._load_task.signals.finished.connect(self._on_file_loaded)
+        self._load_task.signals.error.connect(self._on_file_load_error)
+        QThreadPool.globalInstance().start(self._load_task)
+
+    def _on_file_loaded(self, content: str, size: int):
+        """Apply loaded content to the editor."""
+        self._load_task = None
+        self.original_content = content
+        self.editor.setPlainText(content)
+        self.editor.setReadOnly(False)
+        self.lbl_size.setText(_format_size(size))
+        self.chk_highlight.setEnabled(True)
+
+        if size > HIGHLIGHT_SIZE_LIMIT and not self.chk_highlight.isHidden():
+            self.chk_highlight.blockSignals(True)
+            self.chk_highlight.setChecked(False)
+            self.chk_highlight.blockSignals(False)
+            self.lbl_status.setText(tr("resources.big_file_no_highlight"))
+            return
+
+        # Attach the highlighter only after the bulk insert so every block
+        # is highlighted once instead of on each inserted chunk.
+        if self.chk_highlight.isChecked() and self.highlighter is None:
+            self.highlighter = self._create_highlighter()
+        self.lbl_status.setText(self._tr_loaded)
+
+    def _create_highlighter(self) -> Optional[QSyntaxHighlighter]:
+        """Create a syntax highlighter for the file type, if supported."""
+        ext = self.file_path.suffix.lower()
+        if ext == '.json':
+            return JsonSyntaxHighlighter(self.editor.document())
+        if ext == '.xml':
+            return XmlSyntaxHighlighter(self.editor.document())
+        return None
+
+    def _on_highlight_toggled(self, checked: bool):
+        """Enable or disable syntax highlighting."""
+        if checked:
+            if self.highlighter is None:
+                self.highlighter = self._create_highlighter()
+        elif self.highlighter is not None:
+            self.highlighter.setDocument(None)
+            self.highlighter = None
+
+    def _on_file_load_error(self, message: str):
+        self._load_task = None
+        QMessageBox.critical(self, tr("common.error"), message)
+        self.reject()
     
     def _update_position(self):
         """Update line/column indicator."""
         cursor = self.editor.textCursor()
         line = cursor.blockNumber() + 1
         col = cursor.columnNumber() + 1
-        self.lbl_position.setText(tr("resources.position").format(line=line, col=col))
+        self.lbl_position.setText(self._tr_position_fmt.format(line=line, col=col))
     
     def _on_text_changed(self):
         """Handle text changes."""
+        self._parsed_json_dirty = True
         if self.editor.toPlainText() != self.original_content:
-            self.lbl_status.setText(f"* {tr('resources.modified')}")
+            self.lbl_status.setText(self._tr_modified)
         else:
-            self.lbl_status.setText(tr("resources.file_loaded"))
+            self.lbl_status.setText(self._tr_loaded)
     
+    @contextmanager
+    def _suspend_highlight(self):
+        """Detach the highlighter during bulk edits and rehighlight once after."""
+        highlighter = self.highlighter
+        if highlighter is not None:
+            highlighter.setDocument(None)
+        try:
+            yield
+        finally:
+            if highlighter is not None:
+                highlighter.setDocument(self.editor.document())
+
     def _format_content(self):
         """Format JSON/XML content."""
         ext = self.file_path.suffix.lower()
-        content = self.editor.toPlainText()
         
         try:
             if ext == '.json':
-                data = json.loads(content)
+                data = self._ensure_parsed_json()
                 formatted = json.dumps(data, indent=4, ensure_ascii=False)
-                self.editor.setPlainText(formatted)
+                with self._suspend_highlight():
+                    self.editor.setPlainText(formatted)
+                # Reformatting does not change the parsed value
+                self._parsed_json = data
+                self._parsed_json_dirty = False
                 self.lbl_status.setText(tr("resources.formatted"))
             elif ext == '.xml':
-                # Basic XML formatting
-                import xml.dom.minidom as minidom
-                dom = minidom.parseString(content.encode('utf-8'))
-                formatted = dom.toprettyxml(indent="    ")
-                # Remove extra blank lines
-                formatted = '\n'.join(line for line in formatted.split('\n') if line.strip())
-                self.editor.setPlainText(formatted)
+                content = self.editor.toPlainText().encode('utf-8')
+                if lxml_etree is not None:
+                    parser = lxml_etree.XMLParser(remove_blank_text=True)
+                    root = lxml_etree.fromstring(content, parser)
+                    lxml_etree.indent(root, space="    ")
+                    doc = root.getroottree()
+                    formatted = lxml_etree.tostring(
+                        doc, encoding='UTF-8', xml_declaration=True,
+                        standalone=doc.docinfo.standalone,
+                    ).decode('utf-8')
+                else:
+                    # Basic XML formatting
+                    import xml.dom.minidom as minidom
+                    dom = minidom.parseString(content)
+                    formatted = dom.toprettyxml(indent="    ")
+                    # Remove extra blank lines
+                    formatted = '\n'.join(line for line in formatted.split('\n') if line.strip())
+                with self._suspend_highlight():
+                    self.editor.setPlainText(formatted)
                 self.lbl_status.setText(tr("resources.formatted"))
             else:
                 self.lbl_status.setText(tr("resources.format_not_supported"))
         except Exception as e:
             QMessageBox.warning(self, tr("common.warning"), f"{tr('resources.format_error')}: {e}")
     
+    def _ensure_parsed_json(self) -> Any:
+        """Parse the editor content as JSON, reusing the last result if unchanged."""
+        if self._parsed_json_dirty:
+            self._parsed_json = json.loads(self.editor.toPlainText())
+            self._parsed_json_dirty = False
+        return self._parsed_json
+
     def _save_and_close(self):
         """Save file and close dialog."""
         try:
@@ -379,7 +608,7 @@ class FileEditorDialog(QDialog):
             
             # Validate JSON if applicable
             if self.file_path.suffix.lower() == '.json':
-                json.loads(content)  # Validate
+                self._ensure_parsed_json()  # Validate
 
             preview = TextDiffPreviewDialog(
                 original_text=self.original_content,
@@ -393,10 +622,10 @@ class FileEditorDialog(QDialog):
             # Create backup
             backup_path = self.file_path.with_suffix(self.file_path.suffix + '.bak')
             if self.file_path.exists():
-                backup_path.write_text(self.original_content, encoding='utf-8')
+                shutil.copy2(self.file_path, backup_path)
 
             # Save file
-            self.file_path.write_text(content, encoding='utf-8')
+            self._write_atomic(content)
             self.accept()
             
         except json.JSONDecodeError as e:
@@ -408,6 +637,25 @@ class FileEditorDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, tr("common.error"), str(e))
 
+    def _write_atomic(self, content: str):
+        """Write content to a temp file next to the target, then swap it in."""
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.file_path.parent, prefix=f".{self.file_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            # mkstemp creates the file as 0600; keep the target's permissions
+            if self.file_path.exists():
+                shutil.copymode(self.file_path, tmp_name)
+            os.replace(tmp_name, self.file_path)
+        except Exception:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
     def _show_find(self):
         """Show find bar and focus the search box."""
         self.find_bar.setVisible(True)
@@ -558,35 +806,37 @@ class TextDiffPreviewDialog(QDialog):
 
         tabs = QTabWidget()
 
-        diff_text = "\n".join(
-            difflib.unified_diff(
-                self._original.splitlines(),
-                self._updated.splitlines(),
-                fromfile=tr('resources.original'),
-                tofile=tr('resources.updated'),
-                lineterm="",
-            )
-        ).strip()
+        diff_iter = difflib.unified_diff(
+            self._original.splitlines(),
+            self._updated.splitlines(),
+            fromfile=tr('resources.original'),
+            tofile=tr('resources.updated'),
+            lineterm="",
+        )
+        diff_lines = list(itertools.islice(diff_iter, DIFF_PREVIEW_MAX_LINES))
+        truncated = next(diff_iter, None) is not None
+        diff_text = "\n".join(diff_lines).strip()
         if not diff_text:
             diff_text = tr("resources.no_changes")
+        elif truncated:
+            diff_text += f"\n\n... [{tr('resources.diff_truncated').format(count=DIFF_PREVIEW_MAX_LINES)}]"
 
-        diff_view = QPlainTextEdit()
-        diff_view.setReadOnly(True)
-        diff_view.setFont(QFont("Consolas", 10))
+        diff_view = self._create_text_view()
         diff_view.setPlainText(diff_text)
         tabs.addTab(diff_view, tr("resources.diff"))
 
-        original_view = QPlainTextEdit()
-        original_view.setReadOnly(True)
-        original_view.setFont(QFont("Consolas", 10))
-        original_view.setPlainText(self._original)
-        tabs.addTab(original_view, tr("resources.original"))
+        # Full-text tabs are filled on first activation
+        self._original_view = self._create_text_view()
+        tabs.addTab(self._original_view, tr("resources.original"))
+
+        self._updated_view = self._create_text_view()
+        tabs.addTab(self._updated_view, tr("resources.updated"))
 
-        updated_view = QPlainTextEdit()
-        updated_view.setReadOnly(True)
-        updated_view.setFont(QFont("Consolas", 10))
-        updated_view.setPlainText(self._updated)
-        tabs.addTab(updated_view, tr("resources.updated"))
+        self._pending_views = {
+            self._original_view: self._original,
+            self._updated_view: self._updated,
+        }
+        tabs.currentChanged.connect(lambda index: self._populate_tab(tabs.widget(index)))
 
         layout.addWidget(tabs)
 
@@ -602,6 +852,22 @@ class TextDiffPreviewDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def _create_text_view(self) -> QPlainTextEdit:
+        """Create a read-only view tuned for large documents."""
+        view = QPlainTextEdit()
+        view.setReadOnly(True)
+        view.setFont(_mono_font())
+        view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        view.setCenterOnScroll(False)
+        view.document().setUndoRedoEnabled(False)
+        return view
+
+    def _populate_tab(self, view: QWidget):
+        """Fill a full-text view the first time its tab is shown."""
+        text = self._pending_views.pop(view, None)
+        if text is not None:
+            view.setPlainText(text)
+
 
 class ResourcesBrowserWidget(QWidget):
     """Reusable file browser+preview+editor for a single root folder."""
@@ -611,6 +877,9 @@ class ResourcesBrowserWidget(QWidget):
     def __init__(self, parent=None, preset_scope: str = "mods"):
         super().__init__(parent)
         self._root_path: Optional[Path] = None
+        self._snapshot: Optional[_FolderSnapshot] = None
+        self._filter_active = False
+        self._backup_tasks: List[_BackupTask] = []
         self._profile_data: Optional[Dict] = None
         self._preset_manager = None
         self._preset_scope = preset_scope
@@ -621,7 +890,6 @@ class ResourcesBrowserWidget(QWidget):
         """Set the current profile for preset management."""
         self._profile_data = profile_data
         if profile_data:
-            from src.core.config_preset_manager import ConfigPresetManager
             self._preset_manager = ConfigPresetManager(profile_data, scope=self._preset_scope)
         else:
             self._preset_manager = None
@@ -630,6 +898,12 @@ class ResourcesBrowserWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
 
+        # Coalesce keystrokes in the search box into a single filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
         # Root path indicator
         header = QHBoxLayout()
         self.lbl_root = QLabel("")
@@ -675,7 +949,7 @@ class ResourcesBrowserWidget(QWidget):
         search_layout = QHBoxLayout()
         self.txt_search = QLineEdit()
         self.txt_search.setPlaceholderText(tr("common.search"))
-        self.txt_search.textChanged.connect(self._apply_filter)
+        self.txt_search.textChanged.connect(lambda _t: self._filter_timer.start())
         search_layout.addWidget(self.txt_search)
 
         self.cmb_filter = QComboBox()
@@ -750,7 +1024,7 @@ class ResourcesBrowserWidget(QWidget):
 
         self.txt_preview = QPlainTextEdit()
         self.txt_preview.setReadOnly(True)
-        self.txt_preview.setFont(QFont("Consolas", 10))
+        self.txt_preview.setFont(_mono_font())
         right_layout.addWidget(self.txt_preview)
 
         splitter.addWidget(right_panel)
@@ -792,6 +1066,9 @@ class ResourcesBrowserWidget(QWidget):
         self.refresh()
 
     def refresh(self):
+        """Re-scan the root folder and rebuild the tree from the snapshot."""
+        self._snapshot = None
+        self._filter_active = False
         self.tree.clear()
         self.txt_preview.clear()
         self.btn_edit.setEnabled(False)
@@ -803,7 +1080,9 @@ class ResourcesBrowserWidget(QWidget):
             return
 
         self._set_enabled(True)
-        self._populate_tree(self.tree, self._root_path)
+        self._snapshot = _scan_folder(self._root_path)
+        if self._snapshot is not None:
+            self._populate_tree(self._snapshot)
         self.tree.expandToDepth(0)
         self._apply_filter()
         
@@ -817,112 +1096,100 @@ class ResourcesBrowserWidget(QWidget):
         self.btn_refresh.setEnabled(enabled)
 
     def _get_file_category(self, extension: str) -> str:
-        for category, info in FILE_CATEGORIES.items():
-            if extension in info["extensions"]:
-                return category
-        return ""
-
-    def _format_size(self, size: int) -> str:
-        if size < 1024:
-            return f"{size} B"
-        if size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        return f"{size / (1024 * 1024):.2f} MB"
-
-    def _populate_tree(self, tree: QTreeWidget, current_path: Path, parent_item: Optional[QTreeWidgetItem] = None) -> bool:
-        try:
-            items = sorted(current_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-        except PermissionError:
-            return False
-        except Exception:
-            return False
-
-        has_visible = False
-
-        for item in items:
-            if item.name.startswith(".") or not item.is_dir():
-                continue
+        return _suffix_to_category(extension)
 
+    def _populate_tree(self, snapshot: _FolderSnapshot, parent_item: Optional[QTreeWidgetItem] = None):
+        for folder in snapshot.folders:
             folder_item = QTreeWidgetItem()
-            folder_item.setText(0, item.name)
-            folder_item.setData(0, Qt.UserRole, str(item))
+            folder_item.setText(0, folder.path.name)
+            folder_item.setData(0, Qt.UserRole, folder.path)
+            folder_item.setData(0, _KIND_ROLE, ("dir", ""))
+            folder_item.setData(0, _SEARCH_NAME_ROLE, folder.path.name.lower())
             folder_item.setIcon(0, Icons.get_icon("folder"))
             folder_item.setText(1, "")
             folder_item.setText(2, "")
 
-            child_has_visible = self._populate_tree(tree, item, folder_item)
-            if not child_has_visible:
-                continue
+            self._populate_tree(folder, folder_item)
 
             if parent_item is not None:
                 parent_item.addChild(folder_item)
             else:
-                tree.addTopLevelItem(folder_item)
-            has_visible = True
-
-        for item in items:
-            if item.name.startswith(".") or not item.is_file():
-                continue
-            if item.suffix.lower() not in EDITABLE_EXTENSIONS:
-                continue
+                self.tree.addTopLevelItem(folder_item)
 
+        for file_path, suffix, size, mtime in snapshot.files:
             file_item = QTreeWidgetItem()
-            file_item.setText(0, item.name)
-            file_item.setData(0, Qt.UserRole, str(item))
+            file_item.setText(0, file_path.name)
+            file_item.setData(0, Qt.UserRole, file_path)
+            file_item.setData(0, _KIND_ROLE, ("file", suffix))
+            file_item.setData(0, _SEARCH_NAME_ROLE, file_path.name.lower())
 
-            category = self._get_file_category(item.suffix.lower())
+            category = self._get_file_category(suffix)
             icon_name = FILE_CATEGORIES.get(category, {}).get("icon", "edit")
             file_item.setIcon(0, Icons.get_icon(icon_name))
 
-            try:
-                size = item.stat().st_size
-                file_item.setText(1, self._format_size(size))
-            except Exception:
-                file_item.setText(1, "")
-
-            try:
-                mtime = datetime.fromtimestamp(item.stat().st_mtime)
-                file_item.setText(2, mtime.strftime("%Y-%m-%d %H:%M"))
-            except Exception:
+            file_item.setText(1, _format_size(size) if size is not None else "")
+            if mtime is not None:
+                file_item.setText(2, datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M"))
+            else:
                 file_item.setText(2, "")
 
             if parent_item is not None:
                 parent_item.addChild(file_item)
             else:
-                tree.addTopLevelItem(file_item)
-            has_visible = True
-
-        return has_visible
+                self.tree.addTopLevelItem(file_item)
 
     def _apply_filter(self):
+        # A direct call supersedes any pending debounced pass
+        self._filter_timer.stop()
         search_text = self.txt_search.text().lower()
         filter_type = self.cmb_filter.currentData()
 
-        def filter_item(item: QTreeWidgetItem) -> bool:
-            node_path = Path(item.data(0, Qt.UserRole))
-            name = item.text(0).lower()
-
-            if node_path.is_dir():
-                any_child_visible = False
-                for i in range(item.childCount()):
-                    if filter_item(item.child(i)):
-                        any_child_visible = True
+        if not search_text and filter_type == "all":
+            # Nothing to filter: only items hidden by a previous pass need work
+            if self._filter_active:
+                hidden = []
+                it = QTreeWidgetItemIterator(self.tree, QTreeWidgetItemIterator.Hidden)
+                while it.value():
+                    hidden.append(it.value())
+                    it += 1
+                self.tree.setUpdatesEnabled(False)
+                try:
+                    for item in hidden:
+                        item.setHidden(False)
+                finally:
+                    self.tree.setUpdatesEnabled(True)
+                self._filter_active = False
+            return
 
-                visible = any_child_visible
-                if search_text:
-                    visible = (search_text in name) or any_child_visible
-                item.setHidden(not visible)
-                return visible
+        items = []
+        it = QTreeWidgetItemIterator(self.tree)
+        while it.value():
+            items.append(it.value())
+            it += 1
 
-            matches_search = (not search_text) or (search_text in name)
-            category = self._get_file_category(node_path.suffix.lower())
-            matches_type = (filter_type == "all") or (category == filter_type)
-            visible = matches_search and matches_type
-            item.setHidden(not visible)
-            return visible
+        match_all_types = filter_type == "all"
 
-        for i in range(self.tree.topLevelItemCount()):
-            filter_item(self.tree.topLevelItem(i))
+        # Repaint once after all visibility changes
+        self.tree.setUpdatesEnabled(False)
+        try:
+            # Reversed pre-order visits every child before its parent folder
+            for item in reversed(items):
+                kind, suffix = item.data(0, _KIND_ROLE)
+                name = item.data(0, _SEARCH_NAME_ROLE)
+
+                if kind == "dir":
+                    visible = any(not item.child(i).isHidden() for i in range(item.childCount()))
+                    if search_text and search_text in name:
+                        visible = True
+                else:
+                    # Category lookup only matters when a type filter is set
+                    visible = ((not search_text) or (search_text in name)) and (
+                        match_all_types or self._get_file_category(suffix) == filter_type
+                    )
+                item.setHidden(not visible)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+        self._filter_active = True
 
     def _on_selection_changed(self):
         items = self.tree.selectedItems()
@@ -934,10 +1201,11 @@ class ResourcesBrowserWidget(QWidget):
             return
 
         item = items[0]
-        file_path = Path(item.data(0, Qt.UserRole))
-        if file_path.is_file():
+        file_path = item.data(0, Qt.UserRole)
+        kind, suffix = item.data(0, _KIND_ROLE)
+        if kind == "file":
             self._preview_file(file_path)
-            is_editable = file_path.suffix.lower() in EDITABLE_EXTENSIONS
+            is_editable = suffix in EDITABLE_EXTENSIONS
             self.btn_edit.setEnabled(is_editable)
             self._set_file_preset_buttons_enabled(is_editable and self._preset_manager is not None)
             self._update_preset_indicator(file_path)
@@ -978,37 +1246,41 @@ class ResourcesBrowserWidget(QWidget):
     def _preview_file(self, file_path: Path):
         try:
             max_size = 500 * 1024
-            size = file_path.stat().st_size
-            if size > max_size:
-                self.txt_preview.setPlainText(
-                    f"[{tr('resources.file_too_large')}]\n\n{tr('resources.size')}: {self._format_size(size)}"
-                )
-                return
-
-            content = file_path.read_text(encoding="utf-8", errors="replace")
-
-            max_lines = 1000
-            lines = content.split("\n")
-            if len(lines) > max_lines:
-                content = "\n".join(lines[:max_lines])
-                content += f"\n\n... [{tr('resources.truncated')} {len(lines) - max_lines} {tr('resources.lines')}]"
+            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > max_size:
+                    self.txt_preview.setPlainText(
+                        f"[{tr('resources.file_too_large')}]\n\n{tr('resources.size')}: {_format_size(size)}"
+                    )
+                    return
+
+                # Read only the lines that are shown, plus one to detect truncation
+                max_lines = 1000
+                lines = list(itertools.islice(f, max_lines + 1))
+
+            truncated = len(lines) > max_lines
+            content = "".join(lines[:max_lines])
+            if truncated:
+                if content.endswith("\n"):
+                    content = content[:-1]
+                content += f"\n\n... [{tr('resources.truncated')}]"
 
             self.txt_preview.setPlainText(content)
         except Exception as e:
             self.txt_preview.setPlainText(f"[{tr('common.error')}]\n{e}")
 
     def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
-        file_path = Path(item.data(0, Qt.UserRole))
-        if file_path.is_file() and file_path.suffix.lower() in EDITABLE_EXTENSIONS:
-            self._edit_file(file_path)
+        kind, suffix = item.data(0, _KIND_ROLE)
+        if kind == "file" and suffix in EDITABLE_EXTENSIONS:
+            self._edit_file(item.data(0, Qt.UserRole))
 
     def _edit_selected(self):
         items = self.tree.selectedItems()
         if not items:
             return
-        file_path = Path(items[0].data(0, Qt.UserRole))
-        if file_path.is_file() and file_path.suffix.lower() in EDITABLE_EXTENSIONS:
-            self._edit_file(file_path)
+        kind, suffix = items[0].data(0, _KIND_ROLE)
+        if kind == "file" and suffix in EDITABLE_EXTENSIONS:
+            self._edit_file(items[0].data(0, Qt.UserRole))
 
     def _edit_file(self, file_path: Path):
         dialog = FileEditorDialog(file_path, self)
@@ -1021,11 +1293,12 @@ class ResourcesBrowserWidget(QWidget):
         if not item:
             return
 
-        file_path = Path(item.data(0, Qt.UserRole))
+        file_path = item.data(0, Qt.UserRole)
+        kind, suffix = item.data(0, _KIND_ROLE)
         menu = QMenu(self)
 
-        if file_path.is_file():
-            if file_path.suffix.lower() in EDITABLE_EXTENSIONS:
+        if kind == "file":
+            if suffix in EDITABLE_EXTENSIONS:
                 action_edit = menu.addAction(Icons.get_icon("edit"), tr("common.edit"))
                 action_edit.triggered.connect(lambda: self._edit_file(file_path))
 
@@ -1041,7 +1314,7 @@ class ResourcesBrowserWidget(QWidget):
             action_backup.triggered.connect(lambda: self._create_backup(file_path))
             
             # Preset actions for editable files
-            if file_path.suffix.lower() in EDITABLE_EXTENSIONS and self._preset_manager:
+            if suffix in EDITABLE_EXTENSIONS and self._preset_manager:
                 menu.addSeparator()
                 
                 # Save as default
@@ -1072,50 +1345,51 @@ class ResourcesBrowserWidget(QWidget):
         menu.exec(self.tree.viewport().mapToGlobal(position))
 
     def _open_containing_folder(self, file_path: Path):
-        import subprocess
-        subprocess.run(["explorer", "/select,", str(file_path)])
+        QProcess.startDetached("explorer", ["/select,", str(file_path)])
 
     def _open_folder(self, folder_path: Path):
-        import subprocess
-        subprocess.run(["explorer", str(folder_path)])
+        QProcess.startDetached("explorer", [str(folder_path)])
 
     def _copy_path_to_clipboard(self, path: Path):
-        from PySide6.QtWidgets import QApplication
         QApplication.clipboard().setText(str(path))
 
     def _create_backup(self, file_path: Path):
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"{file_path.stem}_backup_{timestamp}{file_path.suffix}"
-            backup_path = file_path.parent / backup_name
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_name = f"{file_path.stem}_backup_{timestamp}{file_path.suffix}"
+        backup_path = file_path.parent / backup_name
+
+        task = _BackupTask(file_path, backup_path)
+        task.signals.finished.connect(lambda name, t=task: self._on_backup_created(t, name))
+        task.signals.error.connect(lambda message, t=task: self._on_backup_failed(t, message))
+        self._backup_tasks.append(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_backup_created(self, task: _BackupTask, backup_name: str):
+        self._backup_tasks.remove(task)
+        QMessageBox.information(
+            self,
+            tr("common.success"),
+            f"{tr('resources.backup_created')}: {backup_name}",
+        )
+        self.refresh()
 
-            import shutil
-            shutil.copy2(file_path, backup_path)
-
-            QMessageBox.information(
-                self,
-                tr("common.success"),
-                f"{tr('resources.backup_created')}: {backup_name}",
-            )
-            self.refresh()
-        except Exception as e:
-            QMessageBox.critical(self, tr("common.error"), str(e))
+    def _on_backup_failed(self, task: _BackupTask, message: str):
+        self._backup_tasks.remove(task)
+        QMessageBox.critical(self, tr("common.error"), message)
 
     # ==================== Preset Operations ====================
     
     def _get_all_config_files(self) -> List[Path]:
-        """Get all editable config files in the tree."""
+        """Get all editable config files from the last folder scan."""
         files = []
         
-        def collect_files(item: QTreeWidgetItem):
-            path = Path(item.data(0, Qt.UserRole))
-            if path.is_file() and path.suffix.lower() in EDITABLE_EXTENSIONS:
-                files.append(path)
-            for i in range(item.childCount()):
-                collect_files(item.child(i))
+        def collect_files(snapshot: _FolderSnapshot):
+            for folder in snapshot.folders:
+                collect_files(folder)
+            files.extend(file_path for file_path, _suffix, _size, _mtime in snapshot.files)
         
-        for i in range(self.tree.topLevelItemCount()):
-            collect_files(self.tree.topLevelItem(i))
+        if self._snapshot is not None:
+            collect_files(self._snapshot)
         
         return files
     
@@ -1124,9 +1398,9 @@ class ResourcesBrowserWidget(QWidget):
         items = self.tree.selectedItems()
         if not items:
             return None
-        file_path = Path(items[0].data(0, Qt.UserRole))
-        if file_path.is_file():
-            return file_path
+        kind, _suffix = items[0].data(0, _KIND_ROLE)
+        if kind == "file":
+            return items[0].data(0, Qt.UserRole)
         return None
     
     # --- File-specific preset operations ---
@@ -1424,8 +1698,9 @@ class ResourcesBrowserWidget(QWidget):
             return
         
         def update_item(item: QTreeWidgetItem):
-            path = Path(item.data(0, Qt.UserRole))
-            if path.is_file() and path.suffix.lower() in EDITABLE_EXTENSIONS:
+            kind, suffix = item.data(0, _KIND_ROLE)
+            if kind == "file" and suffix in EDITABLE_EXTENSIONS:
+                path = item.data(0, Qt.UserRole)
                 has_default = self._preset_manager.has_default(path)
                 preset_count = self._preset_manager.get_preset_count_all_profiles(path)
                 
@@ -4,12 +4,11 @@ Settings Tab - Application Settings with sub-tabs for organization
 
 from pathlib import Path
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QGroupBox, QFormLayout, QComboBox, QCheckBox, QFileDialog,
-    QMessageBox, QFrame, QTabWidget, QScrollArea, QGridLayout
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFormLayout, QComboBox,
+    QCheckBox, QMessageBox, QFrame, QTabWidget, QScrollArea, QGridLayout
 )
-from PySide6.QtCore import Qt, Signal, QUrl
-from PySide6.QtGui import QDesktopServices
+from PySide6.QtCore import Qt, Signal, QUrl, QTimer, QEvent
+from PySide6.QtGui import QDesktopServices, QPixmap
 
 from src.utils.locale_manager import LocaleManager, tr
 from src.core.settings_manager import SettingsManager
@@ -18,8 +17,73 @@ from src.core.default_restore import restore_server_defaults
 from src.ui.widgets import SectionBox, PathSelector, IconButton
 from src.ui.icons import Icons
 from src.ui.theme_manager import ThemeManager
+from src.ui.themes import ThemeRegistry
 from src.ui.base import BaseTab, BaseSubTab
-from src.ui.factories import create_action_button
+
+
+# Signals are connected attribute-style to plain callables throughout this
+# module; prefer bool-typed signals (toggled) over int-typed ones (stateChanged).
+
+# Delay used to coalesce rapid settings edits into a single disk write
+SAVE_DEBOUNCE_MS = 100
+
+# Static combo box choices: (display text, item data)
+LANGUAGE_CHOICES = (
+    ("English", "en"),
+    ("Tiếng Việt", "vi"),
+)
+DATE_FORMAT_CHOICES = (
+    ("dd/MM/yyyy (31/12/2024)", "dd/MM/yyyy"),
+    ("MM/dd/yyyy (12/31/2024)", "MM/dd/yyyy"),
+    ("yyyy-MM-dd (2024-12-31)", "yyyy-MM-dd"),
+    ("yyyy/MM/dd (2024/12/31)", "yyyy/MM/dd"),
+    ("dd-MM-yyyy (31-12-2024)", "dd-MM-yyyy"),
+    ("dd.MM.yyyy (31.12.2024)", "dd.MM.yyyy"),
+)
+# Item data -> combo index, so loading settings avoids findData scans
+LANGUAGE_INDEX = {data: i for i, (_text, data) in enumerate(LANGUAGE_CHOICES)}
+DATE_FORMAT_INDEX = {data: i for i, (_text, data) in enumerate(DATE_FORMAT_CHOICES)}
+
+
+def _create_choice_combo(choices) -> QComboBox:
+    """Create a combo box filled from (text, data) pairs without per-item signals."""
+    combo = QComboBox()
+    # Size from the known longest label instead of measuring every item
+    combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+    combo.setMinimumContentsLength(max(len(text) for text, _data in choices))
+    combo.blockSignals(True)
+    for text, data in choices:
+        combo.addItem(text, data)
+    combo.blockSignals(False)
+    return combo
+
+
+def _create_desc_label(text: str, role: str | None = None) -> QLabel:
+    """Create a plain-text description label styled by the theme's role rules."""
+    label = QLabel(text)
+    # Translated descriptions never contain markup; skip rich-text detection
+    label.setTextFormat(Qt.PlainText)
+    if role:
+        label.setProperty("role", role)
+    return label
+
+
+def _language_changed_since_last_update(tab: QWidget) -> bool:
+    """Record the current language on a sub-tab; False if it already shows it."""
+    language = LocaleManager.instance().current_language
+    if getattr(tab, "_translated_language", None) == language:
+        return False
+    tab._translated_language = language
+    return True
+
+
+def _create_save_timer(parent: QWidget, settings: SettingsManager) -> QTimer:
+    """Create a single-shot timer that saves settings once edits settle."""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(SAVE_DEBOUNCE_MS)
+    timer.timeout.connect(settings.save)
+    return timer
 
 
 class AppearanceTab(BaseSubTab):
@@ -28,12 +92,22 @@ class AppearanceTab(BaseSubTab):
     language_changed = Signal()
     theme_changed = Signal(str)
     
+    # Rasterized selection checkmarks, keyed by (accent color, size)
+    _check_pixmap_cache: dict[tuple[str, int], QPixmap] = {}
+    
     def __init__(self, settings: SettingsManager, locale: LocaleManager, parent=None):
         super().__init__(parent)
         self.settings = settings
         self.locale = locale
+        self._save_timer = _create_save_timer(self, settings)
+        self._translated_language = locale.current_language
+        # Theme cards are built the first time the tab is shown
+        self._theme_cards_built = False
+        self._theme_cards = {}
+        self._selected_theme_id = None
         self._setup_content()
         self._load_settings()
+        self._connect_signals()
     
     def _setup_content(self):
         
@@ -42,14 +116,10 @@ class AppearanceTab(BaseSubTab):
         lang_form = QFormLayout()
         lang_form.setSpacing(12)
         
-        self.cmb_language = QComboBox()
-        self.cmb_language.addItem("English", "en")
-        self.cmb_language.addItem("Tiếng Việt", "vi")
-        self.cmb_language.currentIndexChanged.connect(self._on_language_changed)
+        self.cmb_language = _create_choice_combo(LANGUAGE_CHOICES)
         lang_form.addRow(tr("settings.select_language") + ":", self.cmb_language)
         
-        self.lbl_lang_desc = QLabel(tr("settings.language_desc"))
-        self.lbl_lang_desc.setStyleSheet("color: gray; font-size: 11px;")
+        self.lbl_lang_desc = _create_desc_label(tr("settings.language_desc"), role="hint")
         lang_form.addRow("", self.lbl_lang_desc)
         
         self.lang_box.add_layout(lang_form)
@@ -60,18 +130,10 @@ class AppearanceTab(BaseSubTab):
         date_form = QFormLayout()
         date_form.setSpacing(12)
         
-        self.cmb_date_format = QComboBox()
-        self.cmb_date_format.addItem("dd/MM/yyyy (31/12/2024)", "dd/MM/yyyy")
-        self.cmb_date_format.addItem("MM/dd/yyyy (12/31/2024)", "MM/dd/yyyy")
-        self.cmb_date_format.addItem("yyyy-MM-dd (2024-12-31)", "yyyy-MM-dd")
-        self.cmb_date_format.addItem("yyyy/MM/dd (2024/12/31)", "yyyy/MM/dd")
-        self.cmb_date_format.addItem("dd-MM-yyyy (31-12-2024)", "dd-MM-yyyy")
-        self.cmb_date_format.addItem("dd.MM.yyyy (31.12.2024)", "dd.MM.yyyy")
-        self.cmb_date_format.currentIndexChanged.connect(self._on_date_format_changed)
+        self.cmb_date_format = _create_choice_combo(DATE_FORMAT_CHOICES)
         date_form.addRow(tr("settings.select_date_format") + ":", self.cmb_date_format)
         
-        self.lbl_date_desc = QLabel(tr("settings.date_format_desc"))
-        self.lbl_date_desc.setStyleSheet("color: gray; font-size: 11px;")
+        self.lbl_date_desc = _create_desc_label(tr("settings.date_format_desc"), role="hint")
         date_form.addRow("", self.lbl_date_desc)
         
         self.date_box.add_layout(date_form)
@@ -79,43 +141,58 @@ class AppearanceTab(BaseSubTab):
         
         # Theme Section - CurseForge-style theme cards
         self.theme_box = SectionBox(tr("settings.theme"))
-        theme_layout = QVBoxLayout()
-        theme_layout.setSpacing(10)
+        self.theme_box.set_spacing(10)
 
-        self.lbl_theme_desc = QLabel(tr("settings.theme_desc"))
-        self.lbl_theme_desc.setStyleSheet("color: gray; font-size: 11px;")
-        theme_layout.addWidget(self.lbl_theme_desc)
+        self.lbl_theme_desc = _create_desc_label(tr("settings.theme_desc"), role="hint")
+        self.theme_box.add_widget(self.lbl_theme_desc)
 
         # Scrollable grid of theme cards
         self.theme_scroll = QScrollArea()
         self.theme_scroll.setWidgetResizable(True)
         self.theme_scroll.setFrameShape(QFrame.NoFrame)
+        self.theme_box.add_widget(self.theme_scroll)
 
-        self.theme_grid_host = QWidget()
-        self.theme_grid = QGridLayout(self.theme_grid_host)
-        self.theme_grid.setContentsMargins(0, 0, 0, 0)
-        self.theme_grid.setHorizontalSpacing(12)
-        self.theme_grid.setVerticalSpacing(12)
-        self.theme_scroll.setWidget(self.theme_grid_host)
-        theme_layout.addWidget(self.theme_scroll)
-
-        self.theme_box.add_layout(theme_layout)
         self.add_widget(self.theme_box)
         
         self.add_stretch()
 
+    def setVisible(self, visible: bool):
+        # Build before Qt lays out and shows the tab, not in showEvent, so the
+        # cards take part in the first layout pass
+        if visible:
+            self._ensure_theme_cards_built()
+        super().setVisible(visible)
+    
+    def _ensure_theme_cards_built(self):
+        if not self._theme_cards_built:
+            self._theme_cards_built = True
+            self._rebuild_theme_cards()
+    
     def _rebuild_theme_cards(self):
-        # Clear existing cards
-        while self.theme_grid.count():
-            item = self.theme_grid.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
+        # Fill a fresh, detached grid host and swap it in whole: the old cards
+        # go with their host, and nothing repaints until the new one is set
+        old_host = self.theme_scroll.takeWidget()
+        if old_host is not None:
+            old_host.deleteLater()
 
-        from src.ui.themes import ThemeRegistry
+        self.theme_grid_host = QWidget()
+        self.theme_grid = QGridLayout(self.theme_grid_host)
+        self.theme_grid.setContentsMargins(0, 0, 0, 0)
+        self.theme_grid.setHorizontalSpacing(12)
+        self.theme_grid.setVerticalSpacing(12)
+        self._populate_theme_grid()
+        self.theme_scroll.setWidget(self.theme_grid_host)
 
+    def _populate_theme_grid(self):
         self._theme_cards = {}
+        self._theme_name_labels = {}
         themes = ThemeRegistry.get_theme_list()  # [(id, name), ...]
         current_theme_id = self.settings.settings.theme
+        self._selected_theme_id = current_theme_id
+        # Per-theme preview colors, applied to the grid as one stylesheet
+        preview_css = []
+        # Localized display name for the default theme
+        default_label = tr("theme.default")
 
         # 2-column layout like CurseForge
         cols = 2
@@ -126,13 +203,11 @@ class AppearanceTab(BaseSubTab):
             if pack is None:
                 continue
 
-            display_name = pack.name
-            if theme_id == "default":
-                # Localized display name for the default theme.
-                display_name = tr("theme.default")
+            display_name = default_label if theme_id == "default" else pack.name
 
             card = QFrame()
             card.setObjectName("themeCard")
+            card.setProperty("themeId", theme_id)
             card.setProperty("selected", theme_id == current_theme_id)
             card.setCursor(Qt.PointingHandCursor)
 
@@ -151,9 +226,6 @@ class AppearanceTab(BaseSubTab):
             preview_accent = QFrame()
             preview_accent.setObjectName("themeCardAccent")
             preview_accent.setFixedSize(32, 32)
-            preview_accent.setStyleSheet(
-                f"background-color: {pack.colors.accent}; border-radius: 10px;"
-            )
             preview_l.addWidget(preview_accent)
 
             bars_col = QVBoxLayout()
@@ -161,16 +233,17 @@ class AppearanceTab(BaseSubTab):
             bars_col.setSpacing(6)
 
             bar1 = QFrame()
-            bar1.setObjectName("themeCardSkeleton")
+            bar1.setObjectName("themeCardSkeleton1")
             bar1.setFixedHeight(10)
-            bar1.setStyleSheet(
-                f"background-color: {pack.colors.surface}; border-radius: 6px;"
-            )
             bar2 = QFrame()
-            bar2.setObjectName("themeCardSkeleton")
+            bar2.setObjectName("themeCardSkeleton2")
             bar2.setFixedHeight(10)
-            bar2.setStyleSheet(
-                f"background-color: {pack.colors.background_tertiary}; border-radius: 6px;"
+
+            card_sel = f'QFrame#themeCard[themeId="{theme_id}"]'
+            preview_css.append(
+                f"{card_sel} QFrame#themeCardAccent {{ background-color: {pack.colors.accent}; }}\n"
+                f"{card_sel} QFrame#themeCardSkeleton1 {{ background-color: {pack.colors.surface}; }}\n"
+                f"{card_sel} QFrame#themeCardSkeleton2 {{ background-color: {pack.colors.background_tertiary}; }}\n"
             )
 
             bars_col.addWidget(bar1)
@@ -190,6 +263,7 @@ class AppearanceTab(BaseSubTab):
             name = QLabel(display_name)
             name.setObjectName("themeCardName")
             text_col.addWidget(name)
+            self._theme_name_labels[theme_id] = name
 
             if pack.description:
                 desc = QLabel(pack.description or "")
@@ -204,14 +278,11 @@ class AppearanceTab(BaseSubTab):
             check.setFixedSize(22, 22)
             check.setAlignment(Qt.AlignCenter)
             if theme_id == current_theme_id:
-                check.setPixmap(Icons.get_icon("check", color=pack.colors.accent, size=18).pixmap(18, 18))
+                check.setPixmap(self._get_check_pixmap(pack.colors.accent))
             bottom.addWidget(check, alignment=Qt.AlignRight | Qt.AlignVCenter)
             outer.addLayout(bottom)
 
-            def _on_click(_evt=None, tid=theme_id):
-                self._select_theme_card(tid)
-
-            card.mousePressEvent = _on_click  # type: ignore[attr-defined]
+            card.installEventFilter(self)
 
             self._theme_cards[theme_id] = (card, check)
 
@@ -221,30 +292,58 @@ class AppearanceTab(BaseSubTab):
                 col = 0
                 row += 1
 
+        self.theme_grid_host.setStyleSheet("".join(preview_css))
+
         # Fill remaining space
         self.theme_grid.setColumnStretch(0, 1)
         self.theme_grid.setColumnStretch(1, 1)
 
+    def eventFilter(self, obj, event):
+        # Theme cards forward clicks here; the card's themeId names the theme
+        if event.type() == QEvent.MouseButtonPress:
+            theme_id = obj.property("themeId")
+            if theme_id:
+                self._select_theme_card(theme_id)
+                return True
+        return super().eventFilter(obj, event)
+
+    @classmethod
+    def _get_check_pixmap(cls, color: str, size: int = 18) -> QPixmap:
+        """Get the selection checkmark for an accent color, rendering it once."""
+        key = (color, size)
+        pixmap = cls._check_pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = Icons.get_icon("check", color=color, size=size).pixmap(size, size)
+            cls._check_pixmap_cache[key] = pixmap
+        return pixmap
+
     def _select_theme_card(self, theme_id: str):
         if not theme_id:
             return
 
         # Persist
         self.settings.settings.theme = theme_id
-        self.settings.save()
+        self._save_timer.start()
 
         # Apply
         ThemeManager.apply_theme(theme_id)
         self.theme_changed.emit(theme_id)
 
-        # Update UI selection
-        for tid, (card, check) in getattr(self, "_theme_cards", {}).items():
+        # Update UI selection; only the old and new cards change state
+        previous_id = self._selected_theme_id
+        self._selected_theme_id = theme_id
+        if previous_id == theme_id:
+            return
+        for tid in (previous_id, theme_id):
+            entry = self._theme_cards.get(tid)
+            if entry is None:
+                continue
+            card, check = entry
             selected = tid == theme_id
             card.setProperty("selected", selected)
             if selected:
-                from src.ui.themes import ThemeRegistry
                 pack = ThemeRegistry.get(tid) or ThemeRegistry.get_default()
-                check.setPixmap(Icons.get_icon("check", color=pack.colors.accent, size=18).pixmap(18, 18))
+                check.setPixmap(self._get_check_pixmap(pack.colors.accent))
             else:
                 check.clear()
             card.style().unpolish(card)
@@ -252,18 +351,20 @@ class AppearanceTab(BaseSubTab):
     
     def _load_settings(self):
         """Load current settings into UI."""
+        s = self.settings.settings
         # Language
-        current_lang = self.settings.settings.language
-        index = self.cmb_language.findData(current_lang)
-        if index >= 0:
+        index = LANGUAGE_INDEX.get(s.language)
+        if index is not None:
             self.cmb_language.setCurrentIndex(index)
-                # Date format
-        current_date_format = self.settings.settings.datetime_format
-        index = self.cmb_date_format.findData(current_date_format)
-        if index >= 0:
+        # Date format
+        index = DATE_FORMAT_INDEX.get(s.datetime_format)
+        if index is not None:
             self.cmb_date_format.setCurrentIndex(index)
-                # Theme cards
-        self._rebuild_theme_cards()
+    
+    def _connect_signals(self):
+        """Connect change handlers once the loaded values are in place."""
+        self.cmb_language.currentIndexChanged.connect(self._on_language_changed)
+        self.cmb_date_format.currentIndexChanged.connect(self._on_date_format_changed)
     
     def _on_language_changed(self, index):
         """Handle language change."""
@@ -271,7 +372,7 @@ class AppearanceTab(BaseSubTab):
         if lang:
             self.locale.set_language(lang)
             self.settings.settings.language = lang
-            self.settings.save()
+            self._save_timer.start()
             self.language_changed.emit()
 
     def _on_date_format_changed(self, index):
@@ -279,21 +380,36 @@ class AppearanceTab(BaseSubTab):
         date_format = self.cmb_date_format.itemData(index)
         if date_format:
             self.settings.settings.datetime_format = date_format
-            self.settings.save()
+            self._save_timer.start()
 
     def update_texts(self):
         """Update UI texts."""
+        if not _language_changed_since_last_update(self):
+            return
         self.lang_box.setTitle(tr("settings.language"))
         self.lbl_lang_desc.setText(tr("settings.language_desc"))
         self.date_box.setTitle(tr("settings.date_format"))
         self.lbl_date_desc.setText(tr("settings.date_format_desc"))
         self.theme_box.setTitle(tr("settings.theme"))
         self.lbl_theme_desc.setText(tr("settings.theme_desc"))
-        # Rebuild cards so any translated strings (if added later) refresh.
-        try:
+        # Unbuilt cards pick up the new language when first shown.
+        if self._theme_cards_built:
+            try:
+                self._retranslate_theme_cards()
+            except Exception:
+                pass
+    
+    def _retranslate_theme_cards(self):
+        """Update card labels in place; rebuild only if the theme set changed."""
+        theme_ids = [theme_id for theme_id, _ in ThemeRegistry.get_theme_list()]
+        if theme_ids != list(self._theme_cards):
             self._rebuild_theme_cards()
-        except Exception:
-            pass
+            return
+        
+        # Only the default theme has a localized display name
+        name_label = self._theme_name_labels.get("default")
+        if name_label is not None:
+            name_label.setText(tr("theme.default"))
 
 
 class ConfigTab(BaseSubTab):
@@ -302,47 +418,44 @@ class ConfigTab(BaseSubTab):
     def __init__(self, settings: SettingsManager, parent=None):
         super().__init__(parent)
         self.settings = settings
+        self._save_timer = _create_save_timer(self, settings)
+        self._translated_language = LocaleManager.instance().current_language
         self._setup_content()
         self._load_settings()
+        self._connect_signals()
     
     def _setup_content(self):
 
         # Config Files Section (shows independent generated configs)
         try:
-            from src.core.storage_paths import (
-                get_configs_path,
-                get_settings_file_path,
-                get_app_config_file_path,
-            )
+            from src.core.storage_paths import get_configs_path
         except Exception:
             get_configs_path = None  # type: ignore
-            get_settings_file_path = None  # type: ignore
-            get_app_config_file_path = None  # type: ignore
 
-        if get_settings_file_path and get_app_config_file_path:
-            self.files_box = SectionBox(tr("settings.config_files"))
-            files_layout = QVBoxLayout()
-            files_layout.setSpacing(10)
+        self.files_box = SectionBox(tr("settings.config_files"))
+        self.files_box.set_spacing(10)
 
-            files_form = QFormLayout()
-            files_form.setSpacing(8)
+        files_form = QFormLayout()
+        files_form.setSpacing(8)
 
-            self.lbl_settings_file = QLabel(str(get_settings_file_path()))
-            self.lbl_settings_file.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            files_form.addRow(tr("settings.settings_file") + ":", self.lbl_settings_file)
+        # Both managers resolved their file paths at startup; reuse them
+        self.lbl_settings_file = QLabel(str(self.settings.settings_path))
+        self.lbl_settings_file.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        files_form.addRow(tr("settings.settings_file") + ":", self.lbl_settings_file)
 
-            self.lbl_app_file = QLabel(str(get_app_config_file_path()))
-            self.lbl_app_file.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            files_form.addRow(tr("settings.app_config_file") + ":", self.lbl_app_file)
+        self.lbl_app_file = QLabel(str(AppConfigManager.instance().config_path))
+        self.lbl_app_file.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        files_form.addRow(tr("settings.app_config_file") + ":", self.lbl_app_file)
 
-            files_layout.addLayout(files_form)
+        self.files_box.add_layout(files_form)
 
-            btn_open = IconButton(icon_name="folder", text=tr("settings.open_config_folder"), size=16)
-            btn_open.clicked.connect(lambda: self._open_configs_folder(get_configs_path() if get_configs_path else None))
-            files_layout.addWidget(btn_open, alignment=Qt.AlignLeft)
+        btn_open = IconButton(icon_name="folder", text=tr("settings.open_config_folder"), size=16)
+        btn_open.clicked.connect(lambda: self._open_configs_folder(get_configs_path() if get_configs_path else None))
+        self.files_box.add_widget(btn_open, alignment=Qt.AlignLeft)
 
-            self.files_box.add_layout(files_layout)
-            self.add_widget(self.files_box)
+        self.add_widget(self.files_box)
+        
+        s = self.settings.settings
         
         # Default Paths Section
         self.paths_box = SectionBox(tr("settings.default_paths"))
@@ -351,16 +464,14 @@ class ConfigTab(BaseSubTab):
         
         # Workshop path
         self.path_workshop = PathSelector(
-            path=self.settings.settings.default_workshop_path or ""
+            path=s.default_workshop_path or ""
         )
-        self.path_workshop.path_changed.connect(self._on_workshop_changed)
         paths_form.addRow(tr("settings.default_workshop") + ":", self.path_workshop)
         
         # Server path
         self.path_server = PathSelector(
-            path=self.settings.settings.default_server_path or ""
+            path=s.default_server_path or ""
         )
-        self.path_server.path_changed.connect(self._on_server_changed)
         paths_form.addRow(tr("settings.default_server") + ":", self.path_server)
         
         self.paths_box.add_layout(paths_form)
@@ -368,61 +479,50 @@ class ConfigTab(BaseSubTab):
         
         # Data Storage Section
         self.storage_box = SectionBox(tr("settings.data_storage"))
-        storage_layout = QVBoxLayout()
-        storage_layout.setSpacing(12)
+        self.storage_box.set_spacing(12)
         
         self.chk_custom_storage = QCheckBox(tr("settings.use_custom_storage"))
-        self.chk_custom_storage.stateChanged.connect(self._on_storage_toggle)
-        storage_layout.addWidget(self.chk_custom_storage)
+        self.storage_box.add_widget(self.chk_custom_storage)
         
         storage_form = QFormLayout()
         storage_form.setSpacing(8)
         
         # Data path
         self.path_data = PathSelector(
-            path=self.settings.settings.data_storage_path or ""
+            path=s.data_storage_path or ""
         )
-        self.path_data.path_changed.connect(self._on_data_path_changed)
         storage_form.addRow(tr("settings.data_path") + ":", self.path_data)
         
         # Profiles path
         self.path_profiles = PathSelector(
-            path=self.settings.settings.profiles_storage_path or ""
+            path=s.profiles_storage_path or ""
         )
-        self.path_profiles.path_changed.connect(self._on_profiles_path_changed)
         storage_form.addRow(tr("settings.profiles_path") + ":", self.path_profiles)
         
-        storage_layout.addLayout(storage_form)
+        self.storage_box.add_layout(storage_form)
         
-        self.lbl_storage_note = QLabel(tr("settings.storage_note"))
-        self.lbl_storage_note.setStyleSheet("color: #ff9800; font-size: 11px;")
+        self.lbl_storage_note = _create_desc_label(tr("settings.storage_note"), role="warning")
         self.lbl_storage_note.setWordWrap(True)
-        storage_layout.addWidget(self.lbl_storage_note)
+        self.storage_box.add_widget(self.lbl_storage_note)
         
-        self.storage_box.add_layout(storage_layout)
         self.add_widget(self.storage_box)
         
         # Restore Defaults Section
         self.restore_box = SectionBox(tr("settings.restore_section"))
-        restore_layout = QVBoxLayout()
-        restore_layout.setSpacing(12)
+        self.restore_box.set_spacing(12)
         
-        self.lbl_restore_desc = QLabel(tr("settings.restore_desc"))
+        self.lbl_restore_desc = _create_desc_label(tr("settings.restore_desc"))
         self.lbl_restore_desc.setWordWrap(True)
-        restore_layout.addWidget(self.lbl_restore_desc)
+        self.restore_box.add_widget(self.lbl_restore_desc)
         
-        btn_layout = QHBoxLayout()
         self.btn_restore = IconButton(
             icon_name="restore",
             text=tr("settings.restore_defaults"),
             size=16
         )
         self.btn_restore.clicked.connect(self._restore_defaults)
-        btn_layout.addWidget(self.btn_restore)
-        btn_layout.addStretch()
-        restore_layout.addLayout(btn_layout)
+        self.restore_box.add_widget(self.btn_restore, alignment=Qt.AlignLeft)
         
-        self.restore_box.add_layout(restore_layout)
         self.add_widget(self.restore_box)
         
         self.add_stretch()
@@ -437,45 +537,54 @@ class ConfigTab(BaseSubTab):
     
     def _load_settings(self):
         """Load current settings into UI."""
-        self.path_workshop.set_path(self.settings.settings.default_workshop_path or "")
-        self.path_server.set_path(self.settings.settings.default_server_path or "")
-        self.path_data.set_path(self.settings.settings.data_storage_path or "")
-        self.path_profiles.set_path(self.settings.settings.profiles_storage_path or "")
-        
-        self.chk_custom_storage.setChecked(self.settings.settings.use_custom_storage)
-        self._update_storage_ui_state()
+        s = self.settings.settings
+        self.path_workshop.set_path(s.default_workshop_path or "")
+        self.path_server.set_path(s.default_server_path or "")
+        self.path_data.set_path(s.data_storage_path or "")
+        self.path_profiles.set_path(s.profiles_storage_path or "")
+        
+        self.chk_custom_storage.setChecked(s.use_custom_storage)
+        self._update_storage_ui_state(s.use_custom_storage)
+    
+    def _connect_signals(self):
+        """Connect change handlers once the loaded values are in place."""
+        self.path_workshop.path_changed.connect(self._on_workshop_changed)
+        self.path_server.path_changed.connect(self._on_server_changed)
+        self.chk_custom_storage.toggled.connect(self._on_storage_toggle)
+        self.path_data.path_changed.connect(self._on_data_path_changed)
+        self.path_profiles.path_changed.connect(self._on_profiles_path_changed)
     
-    def _update_storage_ui_state(self):
+    def _update_storage_ui_state(self, enabled: bool):
         """Enable/disable storage path controls."""
-        enabled = self.chk_custom_storage.isChecked()
         self.path_data.set_enabled(enabled)
         self.path_profiles.set_enabled(enabled)
     
-    def _on_storage_toggle(self, state):
+    def _on_storage_toggle(self, enabled: bool):
         """Handle storage toggle."""
-        self._update_storage_ui_state()
-        self.settings.settings.use_custom_storage = bool(state)
-        self.settings.save()
+        self._update_storage_ui_state(enabled)
+        if self.settings.settings.use_custom_storage != enabled:
+            self.settings.settings.use_custom_storage = enabled
+            self._save_timer.start()
     
     def _on_workshop_changed(self, path):
         """Handle workshop path change."""
         self.settings.settings.default_workshop_path = path
-        self.settings.save()
+        self._save_timer.start()
     
     def _on_server_changed(self, path):
         """Handle server path change."""
         self.settings.settings.default_server_path = path
-        self.settings.save()
+        self._save_timer.start()
     
     def _on_data_path_changed(self, path):
         """Handle data path change."""
         self.settings.settings.data_storage_path = path
-        self.settings.save()
+        self._save_timer.start()
     
     def _on_profiles_path_changed(self, path):
         """Handle profiles path change."""
         self.settings.settings.profiles_storage_path = path
-        self.settings.save()
+        self._save_timer.start()
     
     def _restore_defaults(self):
         """Restore server default files."""
@@ -503,6 +612,8 @@ class ConfigTab(BaseSubTab):
     
     def update_texts(self):
         """Update UI texts."""
+        if not _language_changed_since_last_update(self):
+            return
         if hasattr(self, 'files_box'):
             self.files_box.setTitle(tr("settings.config_files"))
         self.paths_box.setTitle(tr("settings.default_paths"))
@@ -519,48 +630,59 @@ class BehaviorTab(BaseSubTab):
     def __init__(self, settings: SettingsManager, parent=None):
         super().__init__(parent)
         self.settings = settings
+        self._save_timer = _create_save_timer(self, settings)
+        self._translated_language = LocaleManager.instance().current_language
         self._setup_content()
         self._load_settings()
+        self._connect_signals()
     
     def _setup_content(self):
         
         # Behavior Section
         self.behavior_box = SectionBox(tr("settings.behavior"))
-        behavior_layout = QVBoxLayout()
-        behavior_layout.setSpacing(12)
+        self.behavior_box.set_spacing(12)
         
         self.chk_auto_backup = QCheckBox(tr("settings.auto_backup"))
-        self.chk_auto_backup.stateChanged.connect(self._on_setting_changed)
-        behavior_layout.addWidget(self.chk_auto_backup)
+        self.behavior_box.add_widget(self.chk_auto_backup)
         
         self.chk_confirm_actions = QCheckBox(tr("settings.confirm_actions"))
-        self.chk_confirm_actions.stateChanged.connect(self._on_setting_changed)
-        behavior_layout.addWidget(self.chk_confirm_actions)
+        self.behavior_box.add_widget(self.chk_confirm_actions)
         
         self.chk_copy_bikeys = QCheckBox(tr("settings.auto_copy_bikeys"))
-        self.chk_copy_bikeys.stateChanged.connect(self._on_setting_changed)
-        behavior_layout.addWidget(self.chk_copy_bikeys)
+        self.behavior_box.add_widget(self.chk_copy_bikeys)
         
-        self.behavior_box.add_layout(behavior_layout)
         self.add_widget(self.behavior_box)
         
         self.add_stretch()
     
     def _load_settings(self):
         """Load current settings into UI."""
-        self.chk_auto_backup.setChecked(self.settings.settings.auto_backup)
-        self.chk_confirm_actions.setChecked(self.settings.settings.confirm_actions)
-        self.chk_copy_bikeys.setChecked(self.settings.settings.auto_copy_bikeys)
+        s = self.settings.settings
+        self.chk_auto_backup.setChecked(s.auto_backup)
+        self.chk_confirm_actions.setChecked(s.confirm_actions)
+        self.chk_copy_bikeys.setChecked(s.auto_copy_bikeys)
     
-    def _on_setting_changed(self):
+    def _connect_signals(self):
+        """Connect change handlers once the loaded values are in place."""
+        # Each checkbox writes only its own settings field
+        for attr, checkbox in (
+            ("auto_backup", self.chk_auto_backup),
+            ("confirm_actions", self.chk_confirm_actions),
+            ("auto_copy_bikeys", self.chk_copy_bikeys),
+        ):
+            checkbox.toggled.connect(
+                lambda checked, attr=attr: self._on_setting_changed(attr, checked)
+            )
+    
+    def _on_setting_changed(self, attr: str, checked: bool):
         """Handle setting checkbox change."""
-        self.settings.settings.auto_backup = self.chk_auto_backup.isChecked()
-        self.settings.settings.confirm_actions = self.chk_confirm_actions.isChecked()
-        self.settings.settings.auto_copy_bikeys = self.chk_copy_bikeys.isChecked()
-        self.settings.save()
+        setattr(self.settings.settings, attr, checked)
+        self._save_timer.start()
     
     def update_texts(self):
         """Update UI texts."""
+        if not _language_changed_since_last_update(self):
+            return
         self.behavior_box.setTitle(tr("settings.behavior"))
         self.chk_auto_backup.setText(tr("settings.auto_backup"))
         self.chk_confirm_actions.setText(tr("settings.confirm_actions"))
@@ -573,47 +695,48 @@ class AboutTab(BaseSubTab):
     def __init__(self, app_config: AppConfigManager, parent=None):
         super().__init__(parent)
         self.app_config = app_config
+        self._translated_language = LocaleManager.instance().current_language
         self._setup_content()
     
     def _setup_content(self):
         
         # About Section
         self.about_box = SectionBox(tr("settings.about"))
-        about_layout = QVBoxLayout()
-        about_layout.setSpacing(12)
+        self.about_box.set_spacing(12)
         
         # App icon/logo (theme-aware: monochrome on dark, color on light)
         self.logo_label = QLabel()
         self.logo_label.setPixmap(Icons.get_app_logo_pixmap(size=96, variant="auto"))
         self.logo_label.setAlignment(Qt.AlignCenter)
-        about_layout.addWidget(self.logo_label)
-        
-        # App name and version
-        name_label = QLabel(f"<h2>{self.app_config.name}</h2>")
-        name_label.setAlignment(Qt.AlignCenter)
-        about_layout.addWidget(name_label)
-        
-        version_label = QLabel(f"{tr('settings.version')}: {self.app_config.version}")
-        version_label.setAlignment(Qt.AlignCenter)
-        version_label.setStyleSheet("color: gray;")
-        about_layout.addWidget(version_label)
-        
-        # Description
-        desc_label = QLabel(tr("settings.description"))
-        desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("margin-top: 16px;")
-        about_layout.addWidget(desc_label)
-        
-        self.about_box.add_layout(about_layout)
+        self.about_box.add_widget(self.logo_label)
+        
+        # App name, version and description share one rich-text label
+        self.info_label = QLabel(self._info_html())
+        self.info_label.setAlignment(Qt.AlignCenter)
+        self.info_label.setWordWrap(True)
+        self.about_box.add_widget(self.info_label)
+        
         self.add_widget(self.about_box)
         
         self.add_stretch()
     
+    def _info_html(self) -> str:
+        """Build the centered name/version/description block."""
+        return (
+            f"<h2>{self.app_config.name}</h2>"
+            f"<p style='color: gray;'>{tr('settings.version')}: {self.app_config.version}</p>"
+            f"<p style='margin-top: 16px;'>{tr('settings.description')}</p>"
+        )
+    
     def update_texts(self):
         """Update UI texts."""
+        if not _language_changed_since_last_update(self):
+            return
         self.about_box.setTitle(tr("settings.about"))
-        # Texts are static, but the logo may change with theme.
+        self.info_label.setText(self._info_html())
+    
+    def refresh_logo(self):
+        """Re-render the theme-aware logo (call after theme change)."""
         try:
             self.logo_label.setPixmap(Icons.get_app_logo_pixmap(size=96, variant="auto"))
         except Exception:
@@ -628,45 +751,95 @@ class SettingsTab(BaseTab):
     
     def __init__(self, parent=None):
         super().__init__(parent, scrollable=False, title_key="settings.title")
-        self.settings = SettingsManager()
-        self.locale = LocaleManager()
-        self.app_config = AppConfigManager()
-        
-        self._setup_content()
+        self.settings = SettingsManager.instance()
+        self.locale = LocaleManager.instance()
+        self.app_config = AppConfigManager.instance()
+        
+        # Sub-tabs are built on first show; most sessions never open Settings
+        self._built = False
+        # Language the visible texts were last translated into
+        self._translated_language = self.locale.current_language
+    
+    def showEvent(self, event):
+        if not self._built:
+            self._built = True
+            self._setup_content()
+        super().showEvent(event)
     
     def _setup_content(self):
         # Tab widget for sub-tabs
         self.tab_widget = QTabWidget()
         
-        # Create sub-tabs
-        self.tab_appearance = AppearanceTab(self.settings, self.locale)
-        self.tab_appearance.language_changed.connect(self.language_changed.emit)
-        self.tab_appearance.theme_changed.connect(self.theme_changed.emit)
+        # Every sub-tab starts as a placeholder and is built on first activation
+        self._tab_factories = {
+            0: ("tab_appearance", self._create_appearance_tab),
+            1: ("tab_config", lambda: ConfigTab(self.settings)),
+            2: ("tab_behavior", lambda: BehaviorTab(self.settings)),
+            3: ("tab_about", lambda: AboutTab(self.app_config)),
+        }
+        self.tab_widget.addTab(QWidget(), tr("settings.appearance"))
+        self.tab_widget.addTab(QWidget(), tr("settings.paths"))
+        self.tab_widget.addTab(QWidget(), tr("settings.behavior"))
+        self.tab_widget.addTab(QWidget(), tr("settings.about"))
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
         
-        self.tab_config = ConfigTab(self.settings)
-        self.tab_behavior = BehaviorTab(self.settings)
-        self.tab_about = AboutTab(self.app_config)
+        self.add_widget(self.tab_widget)
         
-        # Add sub-tabs
-        self.tab_widget.addTab(self.tab_appearance, tr("settings.appearance"))
-        self.tab_widget.addTab(self.tab_config, tr("settings.paths"))
-        self.tab_widget.addTab(self.tab_behavior, tr("settings.behavior"))
-        self.tab_widget.addTab(self.tab_about, tr("settings.about"))
+        # Build the visible sub-tab once the tab frame has been painted
+        QTimer.singleShot(0, lambda: self._materialize_tab(self.tab_widget.currentIndex()))
+    
+    def _create_appearance_tab(self) -> "AppearanceTab":
+        tab = AppearanceTab(self.settings, self.locale)
+        tab.language_changed.connect(self.language_changed.emit)
+        tab.theme_changed.connect(self.theme_changed.emit)
+        return tab
+    
+    def _materialize_tab(self, index: int):
+        """Replace a placeholder with its real sub-tab on first activation."""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return
+        attr, factory = entry
+        sub_tab = factory()
+        setattr(self, attr, sub_tab)
         
-        self.add_widget(self.tab_widget)
+        placeholder = self.tab_widget.widget(index)
+        title = self.tab_widget.tabText(index)
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, sub_tab, title)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
     
     def update_texts(self):
         """Update all UI texts with current language."""
+        # A language switch can notify twice (observer + signal); retranslate once
+        language = self.locale.current_language
+        if language == self._translated_language:
+            return
+        self._translated_language = language
+        
         super().update_texts()
+        if not self._built:
+            return
         
-        # Update tab titles
-        self.tab_widget.setTabText(0, tr("settings.appearance"))
-        self.tab_widget.setTabText(1, tr("settings.paths"))
-        self.tab_widget.setTabText(2, tr("settings.behavior"))
-        self.tab_widget.setTabText(3, tr("settings.about"))
-        
-        # Update sub-tabs
-        self.tab_appearance.update_texts()
-        self.tab_config.update_texts()
-        self.tab_behavior.update_texts()
-        self.tab_about.update_texts()
+        # Retranslate everything in one pass without intermediate repaints
+        self.setUpdatesEnabled(False)
+        try:
+            # Update tab titles
+            self.tab_widget.setTabText(0, tr("settings.appearance"))
+            self.tab_widget.setTabText(1, tr("settings.paths"))
+            self.tab_widget.setTabText(2, tr("settings.behavior"))
+            self.tab_widget.setTabText(3, tr("settings.about"))
+            
+            # Update sub-tabs; unbuilt ones pick up the language when created
+            for attr in ("tab_appearance", "tab_config", "tab_behavior", "tab_about"):
+                sub_tab = getattr(self, attr, None)
+                if sub_tab is not None:
+                    sub_tab.update_texts()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
@@ -1,12 +1,14 @@
 """Sidebar Navigation Widget - Vortex-style sidebar navigation."""
 
+import weakref
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
     QLabel, QFrame, QListView, QGraphicsDropShadowEffect, QPushButton, QSizePolicy,
     QStyledItemDelegate, QStyle
 )
 from PySide6.QtCore import Qt, Signal, QSize, QRectF, QPropertyAnimation, QEasingCurve, QRect
-from PySide6.QtGui import QFont, QColor, QPainter, QLinearGradient, QPen, QBrush, QIcon
+from PySide6.QtGui import QFont, QColor, QPainter, QLinearGradient, QPen, QBrush, QIcon, QPixmap
 from PySide6.QtWidgets import QStyleOptionViewItem
 
 from src.ui.icons import Icons
@@ -17,62 +19,114 @@ from src.constants.ui import SidebarDimensions
 class _SidebarBrandingHeader(QFrame):
     """A custom-painted header that adapts to the current accent/theme."""
 
+    # Spacing of the diagonal pattern lines; also the pattern tile size
+    _PATTERN_STEP = 16
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._accent = "#43a047"
         self._dark = True
         self.setAttribute(Qt.WA_TranslucentBackground, True)
+        self._update_colors()
 
     def set_theme(self, accent: str, dark: bool):
-        self._accent = accent or "#43a047"
-        self._dark = bool(dark)
+        accent = accent or "#43a047"
+        dark = bool(dark)
+        if (accent, dark) == (self._accent, self._dark):
+            return
+        self._accent = accent
+        self._dark = dark
+        self._update_colors()
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        rect = self.rect()
-
+    def _update_colors(self):
+        """Resolve the paint colors and pens for the current accent/theme."""
         accent = QColor(self._accent)
-        top = QColor(accent)
-        bottom = QColor(accent)
 
         # Make the gradient feel richer without looking neon.
         if self._dark:
-            top = QColor(accent).lighter(112)
-            bottom = QColor(accent).darker(108)
+            self._top = accent.lighter(112)
+            self._bottom = accent.darker(108)
         else:
-            top = QColor(accent).lighter(118)
-            bottom = QColor(accent).darker(112)
+            self._top = accent.lighter(118)
+            self._bottom = accent.darker(112)
+
+        # Soft "aurora" blobs for depth.
+        self._blob1 = QColor(255, 255, 255, 26 if self._dark else 18)
+        self._blob2 = QColor(0, 0, 0, 28 if self._dark else 14)
+
+        # Subtle diagonal pattern and bottom divider.
+        self._pattern_pen = QPen(QColor(255, 255, 255, 10 if self._dark else 8), 1)
+        self._divider_pen = QPen(QColor(0, 0, 0, 80 if self._dark else 55), 1)
+        self._pattern_tile = None
+        self._background = None
+        self._background_key = None
+
+    def _pattern_brush(self) -> QBrush:
+        """Get a tiling brush of the diagonal pattern, rendered once per theme/DPR."""
+        dpr = self.devicePixelRatioF()
+        tile = self._pattern_tile
+        if tile is None or tile.devicePixelRatio() != dpr:
+            step = self._PATTERN_STEP
+            tile = QPixmap(round(step * dpr), round(step * dpr))
+            tile.setDevicePixelRatio(dpr)
+            tile.fill(Qt.transparent)
+            tile_painter = QPainter(tile)
+            tile_painter.setRenderHint(QPainter.Antialiasing, True)
+            tile_painter.setPen(self._pattern_pen)
+            # The lines x + y = k * step, including the neighbours that
+            # clip the tile's corners, so the tiles join seamlessly
+            for x in (-step, 0, step):
+                tile_painter.drawLine(x, step, x + step, 0)
+            tile_painter.end()
+            self._pattern_tile = tile
+        return QBrush(tile)
+
+    def paintEvent(self, event):
+        if event.rect().isEmpty():
+            return
+
+        # The background only changes with size, theme or DPR; render it
+        # into a pixmap once and blit that on every other paint
+        dpr = self.devicePixelRatioF()
+        key = (self.size(), self._accent, self._dark, dpr)
+        if key != self._background_key:
+            background = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            background.setDevicePixelRatio(dpr)
+            background.fill(Qt.transparent)
+            background_painter = QPainter(background)
+            self._paint_background(background_painter, self.rect())
+            background_painter.end()
+            self._background = background
+            self._background_key = key
+
+        painter = QPainter(self)
+        painter.setClipRegion(event.region())
+        painter.drawPixmap(0, 0, self._background)
+        painter.end()
+
+    def _paint_background(self, painter: QPainter, rect: QRect):
+        painter.setRenderHint(QPainter.Antialiasing, True)
 
         grad = QLinearGradient(0, 0, 0, rect.height())
-        grad.setColorAt(0.0, top)
-        grad.setColorAt(1.0, bottom)
+        grad.setColorAt(0.0, self._top)
+        grad.setColorAt(1.0, self._bottom)
         painter.fillRect(rect, QBrush(grad))
 
         # Soft "aurora" blobs for depth.
-        blob1 = QColor(255, 255, 255, 26 if self._dark else 18)
-        blob2 = QColor(0, 0, 0, 28 if self._dark else 14)
         painter.setPen(Qt.NoPen)
-        painter.setBrush(blob1)
+        painter.setBrush(self._blob1)
         painter.drawEllipse(QRectF(-40, -60, rect.width() * 1.05, rect.height() * 1.05))
-        painter.setBrush(blob2)
+        painter.setBrush(self._blob2)
         painter.drawEllipse(QRectF(rect.width() * 0.25, rect.height() * 0.15, rect.width() * 0.95, rect.height() * 0.95))
 
         # Subtle diagonal pattern.
-        pattern = QColor(255, 255, 255, 10 if self._dark else 8)
-        painter.setPen(QPen(pattern, 1))
-        step = 16
-        for x in range(-rect.height(), rect.width(), step):
-            painter.drawLine(x, rect.height(), x + rect.height(), 0)
+        painter.fillRect(rect, self._pattern_brush())
 
         # Bottom divider.
-        divider = QColor(0, 0, 0, 80 if self._dark else 55)
-        painter.setPen(QPen(divider, 1))
+        painter.setPen(self._divider_pen)
         painter.drawLine(0, rect.height() - 1, rect.width(), rect.height() - 1)
 
-        painter.end()
-
 
 class _CollapsedIconDelegate(QStyledItemDelegate):
     """Paints a centered Vortex-style tile with a centered icon (collapsed sidebar)."""
@@ -92,6 +146,15 @@ class _CollapsedIconDelegate(QStyledItemDelegate):
         self._tile_radius = int(tile_radius)
         self._accent_bar_width = int(accent_bar_width)
         self._accent_inset_y = int(accent_inset_y)
+        self._accent = QColor("#43a047")
+        self._accent.setAlpha(220)
+        self._dark = True
+
+    def set_theme(self, accent: str, dark: bool):
+        """Cache the theme colors used by paint()."""
+        self._accent = QColor(accent)
+        self._accent.setAlpha(220)
+        self._dark = bool(dark)
 
     def set_icon_size(self, size: int):
         self._icon_size = int(size)
@@ -116,9 +179,7 @@ class _CollapsedIconDelegate(QStyledItemDelegate):
 
         hovered = bool(opt.state & QStyle.State_MouseOver)
         selected = bool(opt.state & QStyle.State_Selected)
-        
-        # Detect if we're in dark or light mode
-        is_dark = ThemeManager.is_dark_theme()
+        is_dark = self._dark
 
         # Background - use theme-aware colors
         if selected:
@@ -140,12 +201,6 @@ class _CollapsedIconDelegate(QStyledItemDelegate):
 
         # Accent bar when selected.
         if selected:
-            try:
-                accent = QColor(ThemeManager.get_accent_color())
-            except Exception:
-                accent = QColor("#43a047")
-            accent.setAlpha(220)
-
             bar_w = max(1, self._accent_bar_width)
             inset_y = max(0, self._accent_inset_y)
             bar_h = max(0, tile_rect.height() - 2 * inset_y)
@@ -154,7 +209,7 @@ class _CollapsedIconDelegate(QStyledItemDelegate):
             bar_rect = QRect(bar_x, bar_y, bar_w, bar_h)
 
             painter.setPen(Qt.NoPen)
-            painter.setBrush(accent)
+            painter.setBrush(self._accent)
             painter.drawRoundedRect(QRectF(bar_rect), 2.0, 2.0)
 
         if icon.isNull():
@@ -201,6 +256,11 @@ class SidebarWidget(QWidget):
         self._width_anim_min: QPropertyAnimation | None = None
         self._width_anim_max: QPropertyAnimation | None = None
         self._items = []  # Store item data (icon_name, text)
+        # (icon color, icon size) the item icons were last refreshed with
+        self._icon_signature = None
+        # The logo is rendered when the sidebar is first shown, not at build
+        self._logo_stale = False
+        self._last_emitted_row = -1
         self._footer_text = ""
         self._setup_ui()
     
@@ -239,9 +299,22 @@ class SidebarWidget(QWidget):
         self._update_branding_geometry()
         self._apply_branding_effects()
 
-        # Keep the branding updated when the theme changes.
+        # Keep the branding updated when the theme changes. Hold the sidebar
+        # weakly so a discarded sidebar detaches itself instead of lingering.
+        self_ref = weakref.ref(self)
+
+        def _on_theme_change(*args):
+            sidebar = self_ref()
+            if sidebar is None:
+                try:
+                    ThemeManager.remove_observer(_on_theme_change)
+                except Exception:
+                    pass
+                return
+            sidebar._on_theme_changed(*args)
+
         try:
-            ThemeManager.add_observer(self._on_theme_changed)
+            ThemeManager.add_observer(_on_theme_change)
         except Exception:
             pass
         
@@ -255,6 +328,8 @@ class SidebarWidget(QWidget):
         self.nav_list.setContentsMargins(0, 0, 0, 0)
         self.nav_list.setViewportMargins(0, 0, 0, 0)
         self.nav_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        # Every row shares one height, so let the view skip per-row measuring.
+        self.nav_list.setUniformItemSizes(True)
         # Prevent the extra horizontal scrollbar (especially in collapsed IconMode).
         self.nav_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.nav_list.setMouseTracking(True)
@@ -262,6 +337,9 @@ class SidebarWidget(QWidget):
         # Keep sidebar menu icons at the original small size
         self.nav_list.setIconSize(QSize(self._sidebar_icon_size, self._sidebar_icon_size))
         self.nav_list.currentRowChanged.connect(self._on_row_changed)
+        # Shared by every navigation item
+        self._item_font = QFont()
+        self._item_font.setPointSize(11)
 
         self._default_delegate = self.nav_list.itemDelegate()
         self._collapsed_delegate = _CollapsedIconDelegate(
@@ -270,6 +348,9 @@ class SidebarWidget(QWidget):
             tile_width=self._collapsed_tile_w,
             tile_radius=14,
         )
+        self._collapsed_delegate.set_theme(
+            accent=self.header._accent, dark=self.header._dark
+        )
         
         layout.addWidget(self.nav_list, stretch=1)
 
@@ -289,29 +370,19 @@ class SidebarWidget(QWidget):
         
         # Bottom info bar (footer)
         self.footer = QLabel()
-        self.footer.setStyleSheet("color: #666; font-size: 10px;")
+        self.footer.setObjectName("sidebarFooter")
         self.footer.setAlignment(Qt.AlignCenter)
         # Reserve footer height so toggling collapsed/expanded doesn't move the button vertically.
         self.footer.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        # Pick up the themed footer font before measuring it
+        self.footer.ensurePolished()
         self.footer.setFixedHeight(max(12, int(self.footer.sizeHint().height())))
         layout.addWidget(self.footer)
     
     def add_item(self, icon_name: str, text: str, tooltip: str = ""):
         """Add a navigation item with SVG icon."""
         item = QListWidgetItem(text)
-        # Keep the original item height for menu items
-        item.setSizeHint(QSize(0, SidebarDimensions.ITEM_HEIGHT))
-
-        icon = Icons.get_icon(icon_name, size=self._sidebar_icon_size)
-        item.setIcon(icon)
-        
-        font = QFont()
-        font.setPointSize(11)
-        item.setFont(font)
-        item.setTextAlignment(Qt.AlignVCenter)
-        
-        self.nav_list.addItem(item)
-        self._items.append((icon_name, text))
+        item.setFont(self._item_font)
 
         # If collapsed, keep new items icon-only too.
         if self._collapsed:
@@ -323,9 +394,33 @@ class SidebarWidget(QWidget):
             item.setIcon(Icons.get_icon(icon_name, size=SidebarDimensions.COLLAPSED_ICON_SIZE))
         else:
             item.setToolTip(tooltip)
+            item.setTextAlignment(Qt.AlignVCenter)
+            # Keep the original item height for menu items
+            item.setSizeHint(QSize(0, SidebarDimensions.ITEM_HEIGHT))
+            item.setIcon(Icons.get_icon(icon_name, size=self._sidebar_icon_size))
+
+        # Add the fully configured item and its record together so the list
+        # and self._items cannot drift apart
+        self.nav_list.addItem(item)
+        self._items.append((icon_name, text))
+    
+    def add_items(self, entries):
+        """Add several navigation items as (icon_name, text, tooltip) tuples.
+
+        Prefer this over repeated add_item calls when populating the sidebar;
+        the list is relaid out and repainted once for the whole batch.
+        """
+        self.nav_list.setUpdatesEnabled(False)
+        try:
+            for icon_name, text, tooltip in entries:
+                self.add_item(icon_name, text, tooltip)
+        finally:
+            self.nav_list.setUpdatesEnabled(True)
     
     def set_current_index(self, index: int):
         """Set the current selected index."""
+        if index == self.nav_list.currentRow():
+            return
         self.nav_list.setCurrentRow(index)
     
     def get_current_index(self) -> int:
@@ -336,18 +431,18 @@ class SidebarWidget(QWidget):
         """Update text and icon of an item at index."""
         item = self.nav_list.item(index)
         if item:
+            # Alignment and size hints already match the current mode (see
+            # add_item/set_collapsed); only the text and a changed icon need work.
+            icon_changed = index >= len(self._items) or self._items[index][0] != icon_name
             if self._collapsed:
                 item.setToolTip(tooltip or text)
-                item.setText("")
-                item.setTextAlignment(Qt.AlignCenter)
-                item.setSizeHint(QSize(max(0, self.nav_list.viewport().width()), self._collapsed_item_h))
-                item.setIcon(Icons.get_icon(icon_name, size=SidebarDimensions.COLLAPSED_ICON_SIZE))
+                if icon_changed:
+                    item.setIcon(Icons.get_icon(icon_name, size=SidebarDimensions.COLLAPSED_ICON_SIZE))
             else:
                 item.setToolTip(tooltip)
                 item.setText(text)
-                item.setTextAlignment(Qt.AlignVCenter)
-                item.setSizeHint(QSize(0, SidebarDimensions.ITEM_HEIGHT))
-                item.setIcon(Icons.get_icon(icon_name, size=self._sidebar_icon_size))
+                if icon_changed:
+                    item.setIcon(Icons.get_icon(icon_name, size=self._sidebar_icon_size))
             
             # Update stored data
             if index < len(self._items):
@@ -356,16 +451,29 @@ class SidebarWidget(QWidget):
     def refresh_icons(self):
         """Refresh all icons (call after theme change)."""
         size = SidebarDimensions.COLLAPSED_ICON_SIZE if self._collapsed else self._sidebar_icon_size
-        for i, (icon_name, text) in enumerate(self._items):
-            item = self.nav_list.item(i)
-            if item:
-                icon = Icons.get_icon(icon_name, size=size)
-                item.setIcon(icon)
+        signature = (Icons.get_text_color(), size)
+        if signature != self._icon_signature:
+            self._icon_signature = signature
+            # Swap every icon, then repaint the list once
+            self.nav_list.setUpdatesEnabled(False)
+            try:
+                for i, (icon_name, text) in enumerate(self._items):
+                    item = self.nav_list.item(i)
+                    if item:
+                        icon = Icons.get_icon(icon_name, size=size)
+                        item.setIcon(icon)
+            finally:
+                self.nav_list.setUpdatesEnabled(True)
 
         self._refresh_logo()
         self._apply_branding_effects()
 
     def _refresh_logo(self):
+        # Rasterizing the logo is deferred while hidden; showEvent catches up
+        if not self.isVisible():
+            self._logo_stale = True
+            return
+        self._logo_stale = False
         try:
             logo_size = self._compute_logo_size()
             self.logo_label.setPixmap(Icons.get_app_logo_pixmap(size=logo_size, variant="auto"))
@@ -454,7 +562,9 @@ class SidebarWidget(QWidget):
         shadow.setColor(color)
         self.logo_badge.setGraphicsEffect(shadow)
 
-        # btn_collapse is created later in _setup_ui.
+        # The collapsed delegate and btn_collapse are created later in _setup_ui.
+        if hasattr(self, "_collapsed_delegate"):
+            self._collapsed_delegate.set_theme(accent=accent, dark=ThemeManager.is_dark_theme())
         if hasattr(self, "btn_collapse"):
             self._refresh_collapse_button()
 
@@ -558,6 +668,11 @@ class SidebarWidget(QWidget):
             anim.setEndValue(target)
             anim.start()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._logo_stale:
+            self._refresh_logo()
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self._update_branding_geometry()
@@ -574,5 +689,7 @@ class SidebarWidget(QWidget):
     
     def _on_row_changed(self, row: int):
         """Handle row selection change."""
-        if row >= 0:
+        # Don't re-announce the page listeners already switched to
+        if row >= 0 and row != self._last_emitted_row:
+            self._last_emitted_row = row
             self.item_selected.emit(row)
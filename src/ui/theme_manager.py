@@ -32,6 +32,7 @@ class ThemeManager:
     """
     
     _current_theme_id: str = "default"
+    _applied_theme_id: Optional[str] = None  # Theme whose stylesheet is installed
     _observers: List[Callable[[str, ThemePack], None]] = []
     
     @classmethod
@@ -43,6 +44,9 @@ class ThemeManager:
             theme_id: Theme pack ID to apply. If None, uses current theme.
             app: QApplication instance. If None, uses current instance.
             
+        Re-applying the theme that is already installed is a no-op, so
+        callers do not trigger an application-wide restyle.
+        
         Returns:
             True if theme was applied successfully, False otherwise.
         """
@@ -61,8 +65,12 @@ class ThemeManager:
             theme = ThemeRegistry.get_default()
             cls._current_theme_id = theme.id
         
+        if cls._applied_theme_id == cls._current_theme_id:
+            return True
+        
         # Apply stylesheet
         app.setStyleSheet(theme.get_stylesheet())
+        cls._applied_theme_id = cls._current_theme_id
         
         # Clear icon cache when theme changes
         try:
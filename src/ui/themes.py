@@ -4,7 +4,7 @@ CurseForge-style theme packs for scalable theming.
 Each theme is a self-contained pack with all colors and styles defined.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, astuple
 from typing import Dict, Optional
 from enum import Enum
 
@@ -58,8 +58,19 @@ class ThemePack:
     description: str = ""            # Optional description
     colors: ThemeColors = field(default_factory=ThemeColors)
     is_dark: bool = True             # For system integration hints
+    # Generated stylesheet and the palette it was generated from
+    _stylesheet: str = field(default="", init=False, repr=False, compare=False)
+    _stylesheet_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def get_stylesheet(self) -> str:
+        """Get the complete QSS stylesheet for this theme (cached per palette)."""
+        key = astuple(self.colors)
+        if key != self._stylesheet_key:
+            self._stylesheet = self._build_stylesheet()
+            self._stylesheet_key = key
+        return self._stylesheet
+    
+    def _build_stylesheet(self) -> str:
         """Generate the complete QSS stylesheet for this theme."""
         c = self.colors
         
@@ -93,6 +104,11 @@ QListWidget#sidebar {{
     font-size: 13px;
 }}
 
+QLabel#sidebarFooter {{
+    color: #666;
+    font-size: 10px;
+}}
+
 QPushButton#sidebarCollapseBtn {{
     background-color: rgba(255, 255, 255, 0.14);
     border: 1px solid rgba(255, 255, 255, 0.22);
@@ -164,11 +180,27 @@ QFrame#themeCardPreview {{
     border-radius: 12px;
 }}
 
-QFrame#themeCardSkeleton {{
+QFrame#themeCardAccent {{
+    background-color: {c.accent};
+    border-radius: 10px;
+}}
+
+QFrame#themeCardSkeleton1, QFrame#themeCardSkeleton2 {{
     background-color: {c.surface};
     border-radius: 6px;
 }}
 
+/* ==================== HINT LABELS ==================== */
+QLabel[role="hint"] {{
+    color: gray;
+    font-size: 11px;
+}}
+
+QLabel[role="warning"] {{
+    color: {c.warning};
+    font-size: 11px;
+}}
+
 /* ==================== GROUP BOXES ==================== */
 QGroupBox {{
     font-weight: bold;
@@ -84,5 +84,8 @@ class ColorPicker(QWidget):
         return self._color
     
     def set_color(self, color: str):
+        # Skip the stylesheet re-parse when the color is unchanged
+        if color == self._color:
+            return
         self._color = color
         self._update_display()
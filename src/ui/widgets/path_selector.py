@@ -2,10 +2,12 @@
 Path Selector Widget - A text field with browse button for path selection.
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QLineEdit, QLabel, QFileDialog
 )
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, Signal
 
 from src.ui.widgets.icon_button import IconButton
 from src.utils.locale_manager import tr
@@ -23,6 +25,9 @@ class PathSelector(QWidget):
     
     path_changed = Signal(str)
     
+    # Folder picker shared by all selectors; built on first browse
+    _dir_dialog: Optional[QFileDialog] = None
+    
     def __init__(
         self, 
         label: str = "",
@@ -99,17 +104,32 @@ class PathSelector(QWidget):
                 self._file_filter
             )
         else:
-            path = QFileDialog.getExistingDirectory(
-                self,
-                tr("common.select"),
-                self._path or ""
-            )
+            dialog = self._directory_dialog()
+            dialog.setWindowTitle(tr("common.select"))
+            if self._path:
+                dialog.setDirectory(self._path)
+            path = ""
+            if dialog.exec():
+                selected = dialog.selectedFiles()
+                path = selected[0] if selected else ""
         
         if path:
             self._path = path
             self._update_display()
             self.path_changed.emit(path)
     
+    @classmethod
+    def _directory_dialog(cls) -> QFileDialog:
+        """Get the shared folder dialog, creating it on first use."""
+        if cls._dir_dialog is None:
+            # Parentless so it outlives any single selector
+            dialog = QFileDialog()
+            dialog.setFileMode(QFileDialog.Directory)
+            dialog.setOption(QFileDialog.ShowDirsOnly, True)
+            dialog.setWindowModality(Qt.ApplicationModal)
+            cls._dir_dialog = dialog
+        return cls._dir_dialog
+    
     def get_path(self) -> str:
         """Get the current path."""
         return self._path
@@ -30,9 +30,12 @@ class SectionBox(QGroupBox):
         self._content_layout.setContentsMargins(12, 16, 12, 12)
         self._content_layout.setSpacing(8)
     
-    def add_widget(self, widget: QWidget):
-        """Add a widget to the section."""
-        self._content_layout.addWidget(widget)
+    def add_widget(self, widget: QWidget, alignment: Qt.AlignmentFlag | None = None):
+        """Add a widget to the section, optionally aligned within its row."""
+        if alignment is None:
+            self._content_layout.addWidget(widget)
+        else:
+            self._content_layout.addWidget(widget, alignment=alignment)
     
     def add_layout(self, layout):
         """Add a layout to the section."""
@@ -22,7 +22,7 @@ def get_app_logo_filename(settings: Optional[object] = None) -> str:
 
     try:
         from src.core.settings_manager import SettingsManager
-        sm = SettingsManager()
+        sm = SettingsManager.instance()
         return getattr(sm.settings, "app_logo", "new_logo.png")
     except Exception:
         return "new_logo.png"
@@ -86,13 +86,29 @@ class LocaleManager:
         self._current_language: str = default_language
         self._fallback_language: str = "en"
         self._translations: Dict[str, Dict[str, Any]] = {}
+        # Flattened "section.key" -> string map for the current language,
+        # with fallback entries merged in, so lookups are a single dict get
+        self._current_map: Dict[str, str] = {}
         self._observers: List[Callable[[str], None]] = []
         
         # Load available translations
-        self._load_all_translations()
+        self._load_initial_translations()
+        self._rebuild_current_map()
         
-    def _load_all_translations(self) -> None:
-        """Load all available locale files."""
+    @classmethod
+    def instance(cls) -> 'LocaleManager':
+        """Get the shared instance without re-running the constructor."""
+        if cls._instance is not None and cls._instance._initialized:
+            return cls._instance
+        return cls()
+    
+    def _load_initial_translations(self) -> None:
+        """
+        Load the fallback and current locale files.
+        
+        Other catalogs are parsed on demand by set_language(), so an
+        English session never reads the remaining locale files.
+        """
         if not self._locales_dir.exists():
             # Fallbacks for frozen builds or unexpected layouts.
             candidates = []
@@ -109,14 +125,28 @@ class LocaleManager:
             print(f"Warning: Locales directory not found: {self._locales_dir}")
             return
             
-        for locale_file in self._locales_dir.glob("*.json"):
-            lang_code = locale_file.stem
-            try:
-                with open(locale_file, 'r', encoding='utf-8') as f:
-                    self._translations[lang_code] = json.load(f)
+        for lang_code in dict.fromkeys((self._fallback_language, self._current_language)):
+            if self._load_translation(lang_code):
                 print(f"Loaded locale: {lang_code}")
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading locale {lang_code}: {e}")
+    
+    @staticmethod
+    def _flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, str]:
+        """Flatten a nested translation dict into dot-notation keys."""
+        flat: Dict[str, str] = {}
+        for k, v in data.items():
+            full_key = f"{prefix}{k}"
+            if isinstance(v, dict):
+                flat.update(LocaleManager._flatten(v, f"{full_key}."))
+            elif isinstance(v, str):
+                flat[full_key] = v
+        return flat
+    
+    def _rebuild_current_map(self) -> None:
+        """Rebuild the resolved lookup map for the current language."""
+        current_map = self._flatten(self._translations.get(self._fallback_language, {}))
+        if self._current_language != self._fallback_language:
+            current_map.update(self._flatten(self._translations.get(self._current_language, {})))
+        self._current_map = current_map
     
     def _load_translation(self, language: str) -> bool:
         """
@@ -150,7 +180,10 @@ class LocaleManager:
             List of LanguageInfo for available locales
         """
         available = []
-        for code in self._translations.keys():
+        codes = dict.fromkeys(self._translations)
+        if self._locales_dir.exists():
+            codes.update(dict.fromkeys(f.stem for f in self._locales_dir.glob("*.json")))
+        for code in codes:
             if code in LANGUAGES:
                 available.append(LANGUAGES[code])
             else:
@@ -191,6 +224,7 @@ class LocaleManager:
         
         # Notify observers of language change
         if old_language != language:
+            self._rebuild_current_map()
             self._notify_observers(language)
         
         return True
@@ -211,12 +245,8 @@ class LocaleManager:
             locale.get("errors.file_not_found", path="/some/path")
             # Returns "File not found: /some/path"
         """
-        # Try current language first
-        value = self._get_nested_value(self._current_language, key)
-        
-        # Fallback to default language
-        if value is None and self._current_language != self._fallback_language:
-            value = self._get_nested_value(self._fallback_language, key)
+        # Current language with fallback entries already merged in
+        value = self._current_map.get(key)
         
         # Use default or key itself
         if value is None:
@@ -308,7 +338,8 @@ class LocaleManager:
     def reload(self) -> None:
         """Reload all translation files from disk."""
         self._translations.clear()
-        self._load_all_translations()
+        self._load_initial_translations()
+        self._rebuild_current_map()
         self._notify_observers(self._current_language)
 
 
@@ -321,7 +352,13 @@ def tr(key: str, default: Optional[str] = None, **kwargs) -> str:
         from src.utils.locale_manager import tr
         text = tr("mods.install")
     """
-    return LocaleManager().get(key, default, **kwargs)
+    manager = LocaleManager.instance()
+    if not kwargs:
+        # Plain lookups skip placeholder handling entirely
+        value = manager._current_map.get(key)
+        if value is not None:
+            return value
+    return manager.get(key, default, **kwargs)
 
 
 # Example usage and testing